@@ -0,0 +1,56 @@
+import numpy
+
+from tk_builder.image_reader import NumpyCanvasImageReader
+from tk_builder.widgets.image_canvas import CanvasImage
+
+from tests import unittest
+
+
+class TestDecimatedTiles(unittest.TestCase):
+    def setUp(self):
+        self.data = numpy.random.randint(0, 256, size=(1100, 1300), dtype='uint8')
+        self.reader = NumpyCanvasImageReader(self.data)
+
+    def test_tiled_reads(self):
+        canvas_image = CanvasImage(self.reader, 300, 200)
+        for decimation in [1, 2, 3, 5]:
+            for full_image_rect in [
+                    (0, 0, 1100, 1300),
+                    (1, 2, 700, 900),
+                    (257, 511, 1100, 1300),
+                    (13, 7, 1500, 1700),  # extends past the image edge
+                    (600, 1250, 2000, 1400)]:
+                y0, x0, y1, x1 = full_image_rect
+                expected = self.data[y0:y1:decimation, x0:x1:decimation]
+                # read twice, so that the second read is from the cached tiles
+                for _ in range(2):
+                    result = canvas_image.get_decimated_image_data_in_full_image_rect(full_image_rect, decimation)
+                    self.assertTrue(numpy.array_equal(result, expected), msg='{}, {}'.format(full_image_rect, decimation))
+        self.assertGreater(len(canvas_image._tile_cache), 0)
+
+    def test_eviction(self):
+        canvas_image = CanvasImage(self.reader, 100, 100)
+        canvas_image.tile_cache_size = 1
+        capacity = canvas_image._get_tile_capacity()
+        # read every tile separately, which is more tiles than the capacity
+        tile_size = 256
+        tile_count = 0
+        for y0 in range(0, 1100, tile_size):
+            for x0 in range(0, 1300, tile_size):
+                full_image_rect = (y0, x0, y0 + tile_size, x0 + tile_size)
+                result = canvas_image.get_decimated_image_data_in_full_image_rect(full_image_rect, 1)
+                self.assertTrue(numpy.array_equal(result, self.data[y0:y0+tile_size, x0:x0+tile_size]))
+                self.assertLessEqual(len(canvas_image._tile_cache), capacity)
+                tile_count += 1
+        self.assertGreater(tile_count, capacity)
+        # the evicted tiles are read again correctly
+        result = canvas_image.get_decimated_image_data_in_full_image_rect((3, 5, 400, 500), 1)
+        self.assertTrue(numpy.array_equal(result, self.data[3:400, 5:500]))
+
+    def test_cleared_cache(self):
+        canvas_image = CanvasImage(self.reader, 300, 200)
+        canvas_image.get_decimated_image_data_in_full_image_rect((0, 0, 1000, 1000), 3)
+        self.reader.numpy_image_data = numpy.full((1100, 1300), 200, dtype='uint8')
+        canvas_image.clear_tile_cache()
+        result = canvas_image.get_decimated_image_data_in_full_image_rect((0, 0, 1000, 1000), 3)
+        self.assertTrue(numpy.all(result == 200))
@@ -0,0 +1,52 @@
+import numpy
+
+from tk_builder.utils.geometry_utils import segment_squared_distances, \
+    closest_segment_group, SegmentTree, \
+    group_minimum_squared_distances, image_yx_to_canvas_xy, canvas_xy_to_image_yx
+
+from tests import unittest
+
+
+class TestSegmentDistances(unittest.TestCase):
+    def test_segment_squared_distances(self):
+        starts = numpy.array([[0, 0], [0, 0], [5, 5]], dtype='float64')
+        ends = numpy.array([[10, 0], [0, 10], [5, 5]], dtype='float64')
+        distances2 = segment_squared_distances(starts, ends, (5, 3))
+        self.assertTrue(numpy.allclose(distances2, [9, 25, 4]))
+
+    def test_group_minimum(self):
+        starts = numpy.array([[0, 0], [10, 0], [20, 20]], dtype='float64')
+        ends = numpy.array([[10, 0], [10, 10], [20, 20]], dtype='float64')
+        offsets = numpy.array([0, 2, 3], dtype='int64')
+        distances2 = group_minimum_squared_distances(starts, ends, offsets, (12, 5))
+        self.assertTrue(numpy.allclose(distances2, [4, 289]))
+
+    def test_closest_segment_group(self):
+        starts = numpy.array([[0, 0], [10, 0], [20, 20], [12, 6]], dtype='float64')
+        ends = numpy.array([[10, 0], [10, 10], [20, 20], [12, 6]], dtype='float64')
+        offsets = numpy.array([0, 2, 3, 4], dtype='int64')
+        index, distance = closest_segment_group(starts, ends, offsets, (12, 5))
+        self.assertEqual(index, 2)
+        self.assertAlmostEqual(distance, 1.0)
+        index, distance = closest_segment_group(starts, ends, offsets, (12, 5), threshold=3)
+        self.assertEqual(index, 0)
+        self.assertAlmostEqual(distance, 2.0)
+
+    def test_segment_tree(self):
+        starts = numpy.random.uniform(0, 100, size=(500, 2))
+        ends = starts + numpy.random.uniform(-5, 5, size=(500, 2))
+        offsets = numpy.arange(0, 501, 5, dtype='int64')
+        tree = SegmentTree(starts, ends)
+        for point in numpy.random.uniform(0, 100, size=(20, 2)):
+            for threshold in [0, 2]:
+                expected = closest_segment_group(starts, ends, offsets, point, threshold=threshold)
+                index, distance = tree.closest_segment_group(starts, ends, offsets, point, threshold=threshold)
+                self.assertEqual(index, expected[0])
+                self.assertAlmostEqual(distance, expected[1])
+
+    def test_coordinate_transforms(self):
+        image_yx = numpy.random.uniform(0, 1000, size=(50, 2))
+        canvas_xy = image_yx_to_canvas_xy(image_yx.ravel().tolist(), 10, 20, 4)
+        self.assertTrue(numpy.allclose(canvas_xy[:, 0], (image_yx[:, 1] - 20)/4))
+        self.assertTrue(numpy.allclose(canvas_xy[:, 1], (image_yx[:, 0] - 10)/4))
+        self.assertTrue(numpy.allclose(canvas_xy_to_image_yx(canvas_xy, 10, 20, 4), image_yx))
@@ -0,0 +1,143 @@
+import queue
+import time
+
+import numpy
+
+from tk_builder.image_reader import NumpyCanvasImageReader
+from tk_builder.widgets.image_canvas import ImageCanvas, AppVariables
+
+from tests import unittest
+
+
+class _FailingReader(NumpyCanvasImageReader):
+    def __getitem__(self, item):
+        raise ValueError('unreadable')
+
+
+class _HeadlessImageCanvas(ImageCanvas):
+    """
+    An image canvas with the tkinter elements omitted, for checking the image
+    load bookkeeping without a display.
+    """
+
+    def __init__(self):
+        self._image_load_queue = queue.Queue()
+        self._image_load_count = 0
+        self._image_load_after_id = None
+        self._animation_after_id = None
+        self.variables = AppVariables()
+        self.variables.state.canvas_width = 200
+        self.variables.state.canvas_height = 100
+        self.installed = []
+        self.scheduled = {}  # the pending after callbacks
+        self._after_count = 0
+
+    def after(self, ms, func=None, *args):
+        self._after_count += 1
+        after_id = 'after#{}'.format(self._after_count)
+        self.scheduled[after_id] = (func, args)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.scheduled.pop(after_id, None)
+
+    def run_scheduled(self, after_id):
+        func, args = self.scheduled.pop(after_id)
+        func(*args)
+
+    def _reinitialize_reader(self, clear_cache=True, display_ready=False):
+        self.installed.append((self.variables.canvas_image_object, display_ready))
+
+
+def _wait_for_load(canvas, timeout=10):
+    start = time.time()
+    while canvas._image_load_queue.empty():
+        if time.time() - start > timeout:
+            raise AssertionError('the background load did not complete')
+        time.sleep(0.01)
+    canvas._poll_image_load(50)
+
+
+class TestBackgroundLoad(unittest.TestCase):
+    def setUp(self):
+        self.data = numpy.random.randint(0, 256, size=(300, 400), dtype='uint8')
+
+    def test_load(self):
+        canvas = _HeadlessImageCanvas()
+        reader = NumpyCanvasImageReader(self.data)
+        canvas.set_image_reader_in_background(reader)
+        _wait_for_load(canvas)
+        self.assertIs(canvas.image_reader, reader)
+        self.assertEqual(len(canvas.installed), 1)
+        self.assertTrue(canvas.installed[0][1])
+
+    def test_failed_load(self):
+        canvas = _HeadlessImageCanvas()
+        reader = NumpyCanvasImageReader(self.data)
+        canvas.set_image_reader(reader)
+        canvas_image_object = canvas.variables.canvas_image_object
+        canvas.set_image_reader_in_background(_FailingReader(self.data))
+        with self.assertLogs('tk_builder.widgets.image_canvas', level='ERROR'):
+            _wait_for_load(canvas)
+        self.assertIs(canvas.variables.canvas_image_object, canvas_image_object)
+        self.assertIs(canvas.image_reader, reader)
+        self.assertEqual(len(canvas.installed), 1)
+        self.assertIsNone(canvas._image_load_after_id)
+
+    def test_superseded_load(self):
+        canvas = _HeadlessImageCanvas()
+        old_reader = NumpyCanvasImageReader(self.data)
+        new_reader = NumpyCanvasImageReader(self.data.copy())
+        canvas.set_image_reader_in_background(old_reader)
+        canvas.set_image_reader(new_reader)
+        self.assertIsNone(canvas._image_load_after_id)
+        _wait_for_load(canvas)
+        self.assertIs(canvas.image_reader, new_reader)
+        self.assertEqual([entry[0].image_reader for entry in canvas.installed], [new_reader, ])
+
+
+class TestAnimation(unittest.TestCase):
+    def test_frames_delivered(self):
+        canvas = _HeadlessImageCanvas()
+        shown = []
+        canvas._animate([1, 2, 3], 10, shown.append)
+        # the first frame is immediate, and each subsequent frame is from an after callback
+        self.assertEqual(shown, [1, ])
+        for expected in [[1, 2], [1, 2, 3]]:
+            self.assertEqual(list(canvas.scheduled), [canvas._animation_after_id, ])
+            canvas.run_scheduled(canvas._animation_after_id)
+            self.assertEqual(shown, expected)
+        canvas.run_scheduled(canvas._animation_after_id)
+        self.assertIsNone(canvas._animation_after_id)
+        self.assertEqual(len(canvas.scheduled), 0)
+
+    def test_stop_animation(self):
+        canvas = _HeadlessImageCanvas()
+        shown = []
+        canvas._animate([1, 2, 3], 10, shown.append)
+        canvas.stop_animation()
+        self.assertIsNone(canvas._animation_after_id)
+        self.assertEqual(len(canvas.scheduled), 0)
+        self.assertEqual(shown, [1, ])
+
+    def test_replaced_animation(self):
+        canvas = _HeadlessImageCanvas()
+        shown = []
+        canvas._animate([1, 2, 3], 10, shown.append)
+        canvas._animate(['a', 'b'], 10, shown.append)
+        self.assertEqual(list(canvas.scheduled), [canvas._animation_after_id, ])
+        while canvas._animation_after_id is not None:
+            canvas.run_scheduled(canvas._animation_after_id)
+        self.assertEqual(shown, [1, 'a', 'b'])
+
+    def test_invalid_frame_rate(self):
+        canvas = _HeadlessImageCanvas()
+        shown = []
+        canvas._animate([1, 2, 3], 10, shown.append)
+        after_id = canvas._animation_after_id
+        for frames_per_second in [0, -5]:
+            with self.assertRaises(ValueError):
+                canvas._animate(['a', 'b'], frames_per_second, shown.append)
+        # the running animation is left alone
+        self.assertEqual(shown, [1, ])
+        self.assertEqual(list(canvas.scheduled), [after_id, ])
@@ -195,6 +195,7 @@ class NumpyCanvasImageReader(CanvasImageReader):
         return None
 
     def __getitem__(self, key):
+        # NB: basic (strided) slicing yields a view, so no data is copied here
         return self.numpy_image_data[key]
 
     @property
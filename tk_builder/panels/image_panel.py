@@ -7,7 +7,6 @@ import os
 import tkinter
 from tkinter.filedialog import asksaveasfilename
 from tkinter.messagebox import askokcancel
-import PIL.Image
 from typing import List
 
 from tk_builder.panel_builder import WidgetPanelNoLabel
@@ -666,8 +665,7 @@ class ImagePanel(Frame):
             save_fname += '.png'
         self._update_image_save_directory(save_fname)
 
-        image_data = self.canvas.variables.canvas_image_object.display_image
-        pil_image = PIL.Image.fromarray(image_data)
+        pil_image = self.canvas.variables.canvas_image_object.display_pil_image
         pil_image.save(save_fname)
 
     def set_image_reader(self, image_reader):
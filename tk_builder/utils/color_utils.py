@@ -5,6 +5,7 @@ A coolection of basic color utils
 __classification__ = "UNCLASSIFIED"
 __author__ = "Jason Casey"
 
+import itertools
 import numpy
 
 from matplotlib import colors
@@ -154,11 +155,9 @@ class ColorCycler(object):
         hex_color_palette : list
         """
         self._n_colors = n_colors
-        self._color_counter = 0
         self._color_list = get_full_hex_palette(hex_color_palette, n_colors)
+        self._color_iterator = itertools.cycle(self._color_list[:n_colors])
 
     @property
     def next_color(self):
-        next_color = self._color_list[self._color_counter]
-        self._color_counter = ((self._color_counter + 1) % self._n_colors)
-        return next_color
+        return next(self._color_iterator)
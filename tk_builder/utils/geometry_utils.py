@@ -0,0 +1,356 @@
+"""
+Basic vectorized geometry helpers for canvas shape queries.
+"""
+
+__classification__ = "UNCLASSIFIED"
+__author__ = "Thomas McCullough"
+
+import numpy
+
+# NB: scipy.spatial and numba are comparatively expensive to import, so are
+#   only imported on first use
+
+_COMPILED_LOOP = None
+_COMPILED_LOOP_RESOLVED = False
+_COMPILED_TRANSFORMS = None
+_COMPILED_TRANSFORMS_RESOLVED = False
+
+
+def segment_squared_distances(starts, ends, point):
+    """
+    Gets the squared distance from the given point to each line segment in the
+    collection. Degenerate (zero length) segments are treated as points.
+
+    Parameters
+    ----------
+    starts : numpy.ndarray
+        The segment start points, of shape `(N, 2)`.
+    ends : numpy.ndarray
+        The segment end points, of shape `(N, 2)`.
+    point : numpy.ndarray|Tuple|List
+        The point of the form `(x, y)`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The squared distances, of shape `(N, )`.
+    """
+
+    point = numpy.asarray(point, dtype=starts.dtype)
+    directions = ends - starts
+    relative = point - starts
+    lengths2 = numpy.sum(directions*directions, axis=1)
+    projection = numpy.sum(relative*directions, axis=1)
+    param = numpy.zeros_like(lengths2)
+    numpy.divide(projection, lengths2, out=param, where=(lengths2 > 0))
+    numpy.clip(param, 0, 1, out=param)
+    diffs = relative - param[:, numpy.newaxis]*directions
+    return numpy.sum(diffs*diffs, axis=1)
+
+
+def group_minimum_squared_distances(starts, ends, offsets, point):
+    """
+    Gets the minimum squared distance from the given point to each group of
+    line segments. The segments for group `i` are given by
+    `starts[offsets[i]:offsets[i+1]]` and `ends[offsets[i]:offsets[i+1]]`, and
+    every group is assumed to be nonempty.
+
+    Parameters
+    ----------
+    starts : numpy.ndarray
+        The segment start points, of shape `(N, 2)`.
+    ends : numpy.ndarray
+        The segment end points, of shape `(N, 2)`.
+    offsets : numpy.ndarray
+        The group offsets, of shape `(M+1, )`, with final entry `N`.
+    point : numpy.ndarray|Tuple|List
+        The point of the form `(x, y)`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The minimum squared distance for each group, of shape `(M, )`.
+    """
+
+    distances2 = segment_squared_distances(starts, ends, point)
+    return numpy.minimum.reduceat(distances2, offsets[:-1])
+
+
+def _closest_segment_group_numpy(starts, ends, offsets, point, threshold2):
+    # NB: the per group minima are never formed, the segments are ordered by
+    #   group so the first segment within threshold belongs to the first group
+    #   within threshold, and the overall closest segment to the closest group
+    distances2 = segment_squared_distances(starts, ends, point)
+    within = numpy.flatnonzero(distances2 <= threshold2)
+    if within.size > 0:
+        group = int(numpy.searchsorted(offsets, within[0], side='right')) - 1
+        return group, float(numpy.min(distances2[offsets[group]:offsets[group+1]]))
+    segment = int(numpy.argmin(distances2))
+    group = int(numpy.searchsorted(offsets, segment, side='right')) - 1
+    return group, float(distances2[segment])
+
+
+def _closest_segment_group_loop(starts, ends, offsets, point_x, point_y, threshold2):
+    # NB: negative values are used as unset sentinels, rather than infinity,
+    #   to keep this valid when compiled with fastmath
+    best_index = -1
+    best_distance2 = -1.0
+    for group in range(offsets.size - 1):
+        group_distance2 = -1.0
+        for i in range(offsets[group], offsets[group+1]):
+            dir_x = ends[i, 0] - starts[i, 0]
+            dir_y = ends[i, 1] - starts[i, 1]
+            rel_x = point_x - starts[i, 0]
+            rel_y = point_y - starts[i, 1]
+            length2 = dir_x*dir_x + dir_y*dir_y
+            param = 0.0
+            if length2 > 0:
+                param = min(1.0, max(0.0, (rel_x*dir_x + rel_y*dir_y)/length2))
+            diff_x = rel_x - param*dir_x
+            diff_y = rel_y - param*dir_y
+            distance2 = diff_x*diff_x + diff_y*diff_y
+            if group_distance2 < 0 or distance2 < group_distance2:
+                group_distance2 = distance2
+        if group_distance2 <= threshold2:
+            return group, group_distance2
+        if best_index < 0 or group_distance2 < best_distance2:
+            best_distance2 = group_distance2
+            best_index = group
+    return best_index, best_distance2
+
+
+def _get_compiled_loop():
+    """
+    Gets the numba compiled version of the single pass loop, if numba is
+    available. This is only attempted once.
+
+    Returns
+    -------
+    None|callable
+    """
+
+    global _COMPILED_LOOP, _COMPILED_LOOP_RESOLVED
+    if not _COMPILED_LOOP_RESOLVED:
+        _COMPILED_LOOP_RESOLVED = True
+        try:
+            from numba import njit
+            _COMPILED_LOOP = njit(cache=True, fastmath=True)(_closest_segment_group_loop)
+        except ImportError:
+            _COMPILED_LOOP = None
+    return _COMPILED_LOOP
+
+
+def closest_segment_group(starts, ends, offsets, point, threshold=0):
+    """
+    Finds the group of line segments closest to the given point. The first
+    group (in order) within `threshold` of the point is returned, if any such
+    exists, otherwise the closest group. This uses a compiled single pass
+    kernel if numba is available, and vectorized numpy otherwise.
+
+    Parameters
+    ----------
+    starts : numpy.ndarray
+        The segment start points, of shape `(N, 2)`.
+    ends : numpy.ndarray
+        The segment end points, of shape `(N, 2)`.
+    offsets : numpy.ndarray
+        The group offsets, of shape `(M+1, )`, with final entry `N`. This
+        requires `M > 0`.
+    point : numpy.ndarray|Tuple|List
+        The point of the form `(x, y)`.
+    threshold : int|float
+        The distance threshold for early selection.
+
+    Returns
+    -------
+    group_index : int
+    distance : float
+    """
+
+    threshold2 = float(threshold)*float(threshold)
+    compiled_loop = _get_compiled_loop()
+    if compiled_loop is not None:
+        index, distance2 = compiled_loop(
+            starts, ends, offsets, float(point[0]), float(point[1]), threshold2)
+    else:
+        index, distance2 = _closest_segment_group_numpy(starts, ends, offsets, point, threshold2)
+    return int(index), float(numpy.sqrt(distance2))
+
+
+def _image_yx_to_canvas_xy_loop(flat_yx, y_offset, x_offset, decimation):
+    count = flat_yx.size//2
+    xy = numpy.empty((count, 2), dtype=numpy.float64)
+    for i in range(count):
+        xy[i, 0] = (flat_yx[2*i+1] - x_offset)/decimation
+        xy[i, 1] = (flat_yx[2*i] - y_offset)/decimation
+    return xy
+
+
+def _canvas_xy_to_image_yx_loop(flat_xy, y_offset, x_offset, decimation):
+    count = flat_xy.size//2
+    yx = numpy.empty((count, 2), dtype=numpy.float64)
+    for i in range(count):
+        yx[i, 0] = flat_xy[2*i+1]*decimation + y_offset
+        yx[i, 1] = flat_xy[2*i]*decimation + x_offset
+    return yx
+
+
+def _get_compiled_transforms():
+    """
+    Gets the numba compiled versions of the coordinate transform loops, if
+    numba is available. This is only attempted once.
+
+    Returns
+    -------
+    None|Tuple[callable, callable]
+    """
+
+    global _COMPILED_TRANSFORMS, _COMPILED_TRANSFORMS_RESOLVED
+    if not _COMPILED_TRANSFORMS_RESOLVED:
+        _COMPILED_TRANSFORMS_RESOLVED = True
+        try:
+            from numba import njit
+            # NB: fastmath is deliberately not used, so the results match numpy exactly
+            _COMPILED_TRANSFORMS = (
+                njit(cache=True)(_image_yx_to_canvas_xy_loop),
+                njit(cache=True)(_canvas_xy_to_image_yx_loop))
+        except ImportError:
+            _COMPILED_TRANSFORMS = None
+    return _COMPILED_TRANSFORMS
+
+
+def image_yx_to_canvas_xy(image_yx, y_offset, x_offset, decimation):
+    """
+    Converts image coordinates in yx order to canvas coordinates in xy order,
+    as `(x - x_offset)/decimation` and `(y - y_offset)/decimation`. This uses
+    a compiled loop if numba is available, and vectorized numpy otherwise.
+
+    Parameters
+    ----------
+    image_yx : numpy.ndarray|Tuple|List
+        The flat coordinates `(y0, x0, y1, x1, ...)`, or an array of shape `(N, 2)`.
+    y_offset : float
+        The image y coordinate of the canvas origin.
+    x_offset : float
+        The image x coordinate of the canvas origin.
+    decimation : float
+        The number of image pixels per canvas pixel.
+
+    Returns
+    -------
+    numpy.ndarray
+        Of shape `(N, 2)`.
+    """
+
+    compiled_transforms = _get_compiled_transforms()
+    if compiled_transforms is not None:
+        flat_yx = numpy.ascontiguousarray(image_yx, dtype='float64').ravel()
+        return compiled_transforms[0](flat_yx, float(y_offset), float(x_offset), float(decimation))
+    xy = numpy.asarray(image_yx, dtype='float64').reshape((-1, 2))[:, ::-1] - (x_offset, y_offset)
+    xy /= decimation
+    return xy
+
+
+def canvas_xy_to_image_yx(canvas_xy, y_offset, x_offset, decimation):
+    """
+    Converts canvas coordinates in xy order to image coordinates in yx order,
+    as `y*decimation + y_offset` and `x*decimation + x_offset`. This uses a
+    compiled loop if numba is available, and vectorized numpy otherwise.
+
+    Parameters
+    ----------
+    canvas_xy : numpy.ndarray|Tuple|List
+        The flat coordinates `(x0, y0, x1, y1, ...)`, or an array of shape `(N, 2)`.
+    y_offset : float
+        The image y coordinate of the canvas origin.
+    x_offset : float
+        The image x coordinate of the canvas origin.
+    decimation : float
+        The number of image pixels per canvas pixel.
+
+    Returns
+    -------
+    numpy.ndarray
+        Of shape `(N, 2)`.
+    """
+
+    compiled_transforms = _get_compiled_transforms()
+    if compiled_transforms is not None:
+        flat_xy = numpy.ascontiguousarray(canvas_xy, dtype='float64').ravel()
+        return compiled_transforms[1](flat_xy, float(y_offset), float(x_offset), float(decimation))
+    yx = numpy.asarray(canvas_xy, dtype='float64').reshape((-1, 2))[:, ::-1]*decimation
+    yx += (y_offset, x_offset)
+    return yx
+
+
+class SegmentTree(object):
+    """
+    A k-d tree index of line segment midpoints, for sub-linear closest
+    segment group queries over a large collection of segments.
+    """
+
+    __slots__ = ('_tree', '_half_length')
+
+    def __init__(self, starts, ends):
+        """
+
+        Parameters
+        ----------
+        starts : numpy.ndarray
+            The segment start points, of shape `(N, 2)`.
+        ends : numpy.ndarray
+            The segment end points, of shape `(N, 2)`.
+        """
+
+        from scipy.spatial import cKDTree
+
+        directions = ends - starts
+        self._tree = cKDTree(0.5*(starts + ends))
+        # every point of a segment is within this distance of its midpoint
+        self._half_length = 0.5*float(numpy.sqrt(numpy.max(numpy.sum(directions*directions, axis=1))))
+
+    def closest_segment_group(self, starts, ends, offsets, point, threshold=0):
+        """
+        Finds the group of line segments closest to the given point, exactly
+        as :func:`closest_segment_group`. The exact distance is only evaluated
+        for segments whose midpoint is near enough to the point to possibly
+        matter.
+
+        Parameters
+        ----------
+        starts : numpy.ndarray
+            The segment start points, of shape `(N, 2)`, used to construct the tree.
+        ends : numpy.ndarray
+            The segment end points, of shape `(N, 2)`, used to construct the tree.
+        offsets : numpy.ndarray
+            The group offsets, of shape `(M+1, )`, with final entry `N`.
+        point : numpy.ndarray|Tuple|List
+            The point of the form `(x, y)`.
+        threshold : int|float
+            The distance threshold for early selection.
+
+        Returns
+        -------
+        group_index : int
+        distance : float
+        """
+
+        point = numpy.asarray(point, dtype=starts.dtype)
+        threshold2 = float(threshold)*float(threshold)
+        # the segment with the nearest midpoint bounds the closest distance
+        _, nearest = self._tree.query(point, k=1)
+        upper_bound = float(numpy.sqrt(
+            segment_squared_distances(starts[nearest:nearest+1], ends[nearest:nearest+1], point)[0]))
+        # any segment within the search radius has its midpoint in this ball
+        radius = max(upper_bound, float(threshold)) + self._half_length
+        candidates = numpy.array(sorted(self._tree.query_ball_point(point, radius)), dtype='int64')
+        distances2 = segment_squared_distances(starts[candidates], ends[candidates], point)
+
+        within = numpy.flatnonzero(distances2 <= threshold2)
+        if within.size > 0:
+            group = int(numpy.searchsorted(offsets, candidates[within[0]], side='right')) - 1
+            in_group = (candidates >= offsets[group]) & (candidates < offsets[group+1])
+            return group, float(numpy.sqrt(numpy.min(distances2[in_group])))
+        index = int(numpy.argmin(distances2))
+        group = int(numpy.searchsorted(offsets, candidates[index], side='right')) - 1
+        return group, float(numpy.sqrt(distances2[index]))
@@ -15,7 +15,11 @@ from tkinter.colorchooser import askcolor
 from tkinter.messagebox import showinfo
 from typing import Union, Tuple, List, Dict
 from collections import OrderedDict
-import copy
+import io
+import math
+import queue
+import threading
+import time
 
 import numpy
 
@@ -23,11 +27,12 @@ from tk_builder.base_elements import BooleanDescriptor, IntegerDescriptor, \
     IntegerTupleDescriptor, StringDescriptor, TypedDescriptor, FloatDescriptor
 from tk_builder.widgets.basic_widgets import Canvas
 from tk_builder.widgets.image_canvas_tool import ImageCanvasTool, \
-    ShapeTypeConstants, get_tool_type, get_tool_name, get_tool_enum, \
-    normalized_rectangle_coordinates
+    ShapeTypeConstants, get_tool_type, get_tool_name, get_tool_enum
 
 from tk_builder.image_reader import CanvasImageReader
 from tk_builder.utils.color_utils import ColorCycler
+from tk_builder.utils.geometry_utils import closest_segment_group, segment_squared_distances, \
+    SegmentTree, image_yx_to_canvas_xy, canvas_xy_to_image_yx
 
 from sarpy.io.general.base import BaseReader
 from sarpy.geometry.geometry_elements import GeometryObject, LinearRing, LineString, Point
@@ -35,6 +40,51 @@ from sarpy.visualization.remap import get_registered_remap, get_remap_list, Rema
 
 logger = logging.getLogger(__name__)
 
+# segment count beyond which closest shape queries use a k-d tree index
+_SEGMENT_TREE_THRESHOLD = 1024
+# for the normalized rectangle corner index (upper left, upper right, lower right,
+# lower left), the pair of corner indices for the equivalent rectangle definition
+_RECT_CORNER_REDEFINITION = ([0, 2], [1, 3], [0, 2], [3, 1])
+# coordinate count (in pairs) from which coordinate conversions use numpy,
+# below this the array construction costs more than it saves
+_VECTORIZED_COORDS_MINIMUM = 16
+# source image pixel count from which display rescaling is performed in row bands
+_TILED_RESIZE_MINIMUM_PIXELS = 4*1024*1024
+# the size, in decimated pixels, of the cached tiles of decimated image data
+_DECIMATED_TILE_SIZE = 256
+# the canvas item tag for all tool shapes, so they can be configured in one call
+_TOOL_SHAPE_TAG = 'tool_shape'
+# the Tk canvas item type for each shape type
+_CANVAS_ITEM_TYPES = {
+    ShapeTypeConstants.POINT: 'oval',
+    ShapeTypeConstants.LINE: 'line',
+    ShapeTypeConstants.ARROW: 'line',
+    ShapeTypeConstants.RECT: 'rectangle',
+    ShapeTypeConstants.ELLIPSE: 'oval',
+    ShapeTypeConstants.POLYGON: 'polygon',
+    ShapeTypeConstants.TEXT: 'text'}
+# the (row, column) indices into the two rectangle defining points which give
+# the closed rectangle outline
+_RECT_OUTLINE_INDICES = (
+    numpy.array([[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]),
+    numpy.array([[0, 1], [0, 1], [0, 1], [0, 1], [0, 1]]))
+# the Tk configuration option which determines the color for each shape type
+_COLOR_OPTION_KEYS = {
+    ShapeTypeConstants.POINT: 'fill',
+    ShapeTypeConstants.LINE: 'fill',
+    ShapeTypeConstants.ARROW: 'fill',
+    ShapeTypeConstants.RECT: 'outline',
+    ShapeTypeConstants.ELLIPSE: 'outline',
+    ShapeTypeConstants.POLYGON: 'outline',
+    ShapeTypeConstants.TEXT: 'fill'}
+# the prefix for the temporary canvas item tags used to recolor shapes in groups
+_RECOLOR_TAG_PREFIX = 'recolor_'
+# the unit circle samples for the ellipse outline, which are fixed
+_ELLIPSE_POINTS = 60
+_ELLIPSE_THETA = numpy.linspace(0, 2*numpy.pi, _ELLIPSE_POINTS)
+_ELLIPSE_COS = numpy.cos(_ELLIPSE_THETA)
+_ELLIPSE_SIN = numpy.sin(_ELLIPSE_THETA)
+
 
 #######
 # helper methods
@@ -51,6 +101,124 @@ def _get_default_remap():
     return get_remap_list()[0][1]
 
 
+def _tiled_resize(pil_image, new_size, resample, tile_rows=256):
+    """
+    Resizes the image in horizontal bands of output rows, so that the working
+    set of each band stays cache resident for large images. Each band is
+    resampled from the corresponding source region, including the filter
+    support beyond it, so this agrees with a single resize up to rounding.
+
+    Parameters
+    ----------
+    pil_image : Image.Image
+    new_size : Tuple[int, int]
+        The output size, in PIL `(width, height)` order.
+    resample : int
+        The PIL resampling filter.
+    tile_rows : int
+        The number of output rows in each band.
+
+    Returns
+    -------
+    Image.Image
+    """
+
+    width, height = pil_image.size
+    new_nx, new_ny = new_size
+    row_scale = height/float(new_ny)
+    out = Image.new(pil_image.mode, new_size)
+    for row_start in range(0, new_ny, tile_rows):
+        row_end = min(new_ny, row_start + tile_rows)
+        band = pil_image.resize(
+            (new_nx, row_end - row_start), resample=resample,
+            box=(0, row_start*row_scale, width, row_end*row_scale))
+        out.paste(band, (0, row_start))
+    return out
+
+
+def _close_ring(coords_array):
+    """
+    Ensures that the final coordinate repeats the first coordinate.
+
+    Parameters
+    ----------
+    coords_array : numpy.ndarray
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    if numpy.all(coords_array[0, :] == coords_array[-1, :]):
+        return coords_array
+    return numpy.vstack((coords_array, coords_array[0, :]))
+
+
+def _get_shape_outline_coords(shape_type, coords_array):
+    """
+    Gets the vertices of the outline for the given shape type, in the
+    same coordinate system as the provided coordinates. The first vertex is
+    repeated at the end for closed shapes.
+
+    Parameters
+    ----------
+    shape_type : int
+    coords_array : numpy.ndarray
+        The shape coordinates, of shape `(N, 2)`.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    if shape_type in [ShapeTypeConstants.TEXT, ShapeTypeConstants.POINT]:
+        return coords_array[:1, :]
+    elif shape_type == ShapeTypeConstants.RECT:
+        # the closed ring, gathered in a single fancy indexing operation
+        return coords_array[_RECT_OUTLINE_INDICES]
+    elif shape_type == ShapeTypeConstants.ELLIPSE:
+        mid_point = 0.5*(coords_array[0, :] + coords_array[1, :])
+        r_0 = 0.5*numpy.abs(coords_array[1, 0] - coords_array[0, 0])
+        r_1 = 0.5*numpy.abs(coords_array[1, 1] - coords_array[0, 1])
+        # the samples end at 2*pi, so the last row is the closing vertex
+        ellipse_coords = numpy.empty((_ELLIPSE_POINTS, 2), dtype='float64')
+        ellipse_coords[:-1, 0] = mid_point[0] + r_0*_ELLIPSE_COS[:-1]
+        ellipse_coords[:-1, 1] = mid_point[1] + r_1*_ELLIPSE_SIN[:-1]
+        ellipse_coords[-1, :] = ellipse_coords[0, :]
+        return ellipse_coords
+    elif shape_type in [ShapeTypeConstants.LINE, ShapeTypeConstants.ARROW]:
+        return coords_array
+    elif shape_type == ShapeTypeConstants.POLYGON:
+        return _close_ring(coords_array)
+    else:
+        raise ValueError(
+            'Unhandled geometry type {} for outline determination'.format(
+                ShapeTypeConstants.get_name(shape_type)))
+
+
+def _get_canvas_drawing_coords(vector_object, canvas_coords):
+    """
+    Gets the integer coordinates for drawing the given shape on the canvas. A
+    point is drawn as an oval around the given location.
+
+    Parameters
+    ----------
+    vector_object : VectorObject
+    canvas_coords : Tuple|List|numpy.ndarray
+
+    Returns
+    -------
+    Tuple
+    """
+
+    if vector_object.type == ShapeTypeConstants.POINT:
+        point_size = vector_object.point_size
+        return (
+            int(canvas_coords[0] - point_size), int(canvas_coords[1] - point_size),
+            int(canvas_coords[0] + point_size), int(canvas_coords[1] + point_size))
+    return tuple(int(entry) for entry in canvas_coords)
+
+
 #######
 # enum type objects
 
@@ -81,6 +249,9 @@ class ToolConstants(object):
         ('NEW_SHAPE', NEW_SHAPE)
     ])
     _values_to_names = OrderedDict([(value, key) for key, value in _names_to_values.items()])
+    # both the names and the values map to the value, for single lookup validation
+    _valid_values = dict(_names_to_values)
+    _valid_values.update(zip(_values_to_names, _values_to_names))
 
     @classmethod
     def validate(cls, value):
@@ -97,11 +268,7 @@ class ToolConstants(object):
         None|int
         """
 
-        if value in cls._names_to_values:
-            return cls._names_to_values[value]
-        if value in cls._values_to_names:
-            return value
-        return None
+        return cls._valid_values.get(value, None)
 
     @classmethod
     def get_name(cls, value):
@@ -126,9 +293,6 @@ class CanvasImage(object):
     canvas_decimated_image = TypedDescriptor(
         'canvas_decimated_image', numpy.ndarray,
         docstring='The canvas decimated image data.')  # type: numpy.ndarray
-    display_image = TypedDescriptor(
-        'display_image', numpy.ndarray,
-        docstring='The display image data.')  # type: numpy.ndarray
     decimation_factor = IntegerDescriptor(
         'decimation_factor', default_value=1,
         docstring='The decimation factor.')  # type: int
@@ -143,8 +307,18 @@ class CanvasImage(object):
         'canvas_ny', docstring='')  # type: int
     canvas_nx = IntegerDescriptor(
         'canvas_nx', docstring='')  # type: int
+    resample = IntegerDescriptor(
+        'resample', default_value=Image.BILINEAR,
+        docstring='The PIL resampling filter for rescaling the decimated '
+                  'image data for display.')  # type: int
+    tile_cache_size = IntegerDescriptor(
+        'tile_cache_size', default_value=64,
+        docstring='The minimum capacity, in tiles, of the cache of decimated image '
+                  'data, so that panning only reads newly visible regions. The '
+                  'capacity is increased as necessary to hold two canvas views. '
+                  'The value 0 disables the tile cache.')  # type: int
 
-    def __init__(self, image_reader, canvas_nx, canvas_ny):
+    def __init__(self, image_reader, canvas_nx, canvas_ny, resample=Image.BILINEAR):
         """
 
         Parameters
@@ -152,9 +326,15 @@ class CanvasImage(object):
         image_reader : CanvasImageReader
         canvas_nx : int
         canvas_ny : int
+        resample : int
+            The PIL resampling filter for display rescaling.
         """
 
         self.drop_bands = []  # type: List
+        self.resample = resample
+        self._display_pil_image = None  # type: Union[None, Image.Image]
+        self._display_image = None  # type: Union[None, numpy.ndarray]
+        self._tile_cache = OrderedDict()  # least recently used first
         self.image_reader = image_reader
         self.canvas_nx = canvas_nx
         self.canvas_ny = canvas_ny
@@ -162,7 +342,8 @@ class CanvasImage(object):
 
     def get_decimated_image_data_in_full_image_rect(self, full_image_rect, decimation):
         """
-        Get decimated data.
+        Get decimated data. Note that this may be a strided view of data held by
+        the image reader (the numpy reader, for instance), rather than a copy.
 
         Parameters
         ----------
@@ -178,12 +359,155 @@ class CanvasImage(object):
         y_end = full_image_rect[2]
         x_start = full_image_rect[1]
         x_end = full_image_rect[3]
+        if self.tile_cache_size > 0 and y_start >= 0 and x_start >= 0:
+            # only use the tiles if they can all be retained, as for a display update
+            tile_span = _DECIMATED_TILE_SIZE*decimation
+            tile_count = ((y_end - y_start)//tile_span + 2)*((x_end - x_start)//tile_span + 2)
+            if tile_count <= self._get_tile_capacity():
+                return self._get_decimated_image_data_from_tiles(y_start, y_end, x_start, x_end, decimation)
         decimated_data = self.image_reader[y_start:y_end:decimation, x_start:x_end:decimation]
         return decimated_data
 
+    def clear_tile_cache(self):
+        """
+        Clears the cached tiles of decimated image data.
+
+        Returns
+        -------
+        None
+        """
+
+        self._tile_cache.clear()
+
+    def _get_tile_capacity(self):
+        """
+        Gets the number of decimated tiles to retain. This is the larger of
+        `tile_cache_size` and the number of tiles for two canvas views, so that
+        large canvases still benefit from the cache.
+
+        Returns
+        -------
+        int
+        """
+
+        tile_size = _DECIMATED_TILE_SIZE
+        view_tiles = (self.canvas_ny//tile_size + 2)*(self.canvas_nx//tile_size + 2)
+        return max(self.tile_cache_size, 2*view_tiles)
+
+    def _get_decimated_tile(self, decimation, phase_y, phase_x, tile_y, tile_x):
+        """
+        Gets the given tile of decimated image data, from the cache if possible.
+        The tile grid for a given decimation and phase consists of the full
+        image rows `phase_y + k*decimation` and columns `phase_x + k*decimation`.
+
+        Parameters
+        ----------
+        decimation : int
+        phase_y : int
+        phase_x : int
+        tile_y : int
+        tile_x : int
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        the_key = (decimation, phase_y, phase_x, tile_y, tile_x)
+        tile = self._tile_cache.get(the_key, None)
+        if tile is not None:
+            self._tile_cache.move_to_end(the_key)
+            return tile
+
+        step = _DECIMATED_TILE_SIZE*decimation
+        y_start = phase_y + tile_y*step
+        x_start = phase_x + tile_x*step
+        tile = self.image_reader[y_start:y_start+step:decimation, x_start:x_start+step:decimation]
+        self._tile_cache[the_key] = tile
+        capacity = self._get_tile_capacity()
+        while len(self._tile_cache) > capacity:
+            self._tile_cache.popitem(last=False)
+        return tile
+
+    def _get_decimated_image_data_from_tiles(self, y_start, y_end, x_start, x_end, decimation):
+        """
+        Assembles the decimated image data `reader[y_start:y_end:decimation, x_start:x_end:decimation]`
+        from cached tiles.
+
+        Parameters
+        ----------
+        y_start : int
+        y_end : int
+        x_start : int
+        x_end : int
+        decimation : int
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        y_end = min(y_end, self.image_reader.full_image_ny)
+        x_end = min(x_end, self.image_reader.full_image_nx)
+        phase_y, first_y = y_start % decimation, y_start//decimation
+        phase_x, first_x = x_start % decimation, x_start//decimation
+        # decimated index ranges, relative to the tile grid for this phase
+        last_y = first_y + len(range(y_start, y_end, decimation))
+        last_x = first_x + len(range(x_start, x_end, decimation))
+
+        out = None
+        tile_size = _DECIMATED_TILE_SIZE
+        for tile_y in range(first_y//tile_size, (last_y - 1)//tile_size + 1):
+            tile_row = tile_y*tile_size
+            row_start, row_end = max(first_y, tile_row), min(last_y, tile_row + tile_size)
+            for tile_x in range(first_x//tile_size, (last_x - 1)//tile_size + 1):
+                tile_column = tile_x*tile_size
+                column_start, column_end = max(first_x, tile_column), min(last_x, tile_column + tile_size)
+                tile = self._get_decimated_tile(decimation, phase_y, phase_x, tile_y, tile_x)
+                if out is None:
+                    out = numpy.empty((last_y - first_y, last_x - first_x) + tile.shape[2:], dtype=tile.dtype)
+                out[row_start-first_y:row_end-first_y, column_start-first_x:column_end-first_x] = \
+                    tile[row_start-tile_row:row_end-tile_row, column_start-tile_column:column_end-tile_column]
+        if out is None:
+            # an empty rectangle
+            return self.image_reader[y_start:y_end:decimation, x_start:x_end:decimation]
+        return out
+
+    @property
+    def display_pil_image(self):
+        # type: () -> Union[None, Image.Image]
+        """
+        None|PIL.Image.Image: The display image.
+        """
+
+        return self._display_pil_image
+
+    @property
+    def display_image(self):
+        # type: () -> Union[None, numpy.ndarray]
+        """
+        None|numpy.ndarray: The display image data. This is only converted from
+        the display image on request.
+        """
+
+        if self._display_image is None and self._display_pil_image is not None:
+            self._display_image = numpy.array(self._display_pil_image)
+        return self._display_image
+
+    @display_image.setter
+    def display_image(self, value):
+        if value is None:
+            self._display_pil_image = None
+        elif isinstance(value, Image.Image):
+            self._display_pil_image = value
+        else:
+            self._display_pil_image = Image.fromarray(value)
+        self._display_image = None
+
     def get_scaled_display_data(self, decimated_image):
         """
-        Gets scaled data for display.
+        Gets scaled data for display. Any drop bands are expected to have
+        already been zeroed.
 
         Parameters
         ----------
@@ -194,20 +518,40 @@ class CanvasImage(object):
         numpy.ndarray
         """
 
-        scale_factor = self.compute_display_scale_factor(decimated_image)
+        return numpy.array(self.get_scaled_display_image(decimated_image))
+
+    def get_scaled_display_image(self, decimated_image, scale_factor=None):
+        """
+        Gets the scaled image for display. Any drop bands are expected to have
+        already been zeroed.
+
+        Parameters
+        ----------
+        decimated_image : numpy.ndarray
+        scale_factor : None|float
+            The display scale factor, if already computed.
+
+        Returns
+        -------
+        PIL.Image.Image
+        """
+
+        if scale_factor is None:
+            scale_factor = self.compute_display_scale_factor(decimated_image)
         new_nx = int(decimated_image.shape[1] * scale_factor)
         new_ny = int(decimated_image.shape[0] * scale_factor)
         if new_nx > self.canvas_nx:
             new_nx = self.canvas_nx
         if new_ny > self.canvas_ny:
             new_ny = self.canvas_ny
-        if len(self.drop_bands) != 0:
-            zeros_image = numpy.zeros_like(decimated_image[:, :, 0])
-            for drop_band in self.drop_bands:
-                decimated_image[:, :, drop_band] = zeros_image
         pil_image = Image.fromarray(decimated_image)
-        display_image = pil_image.resize((new_nx, new_ny))
-        return numpy.array(display_image)
+        if pil_image.size == (new_nx, new_ny):
+            return pil_image  # no rescaling required
+        if self.resample != Image.NEAREST and \
+                decimated_image.shape[0]*decimated_image.shape[1] >= _TILED_RESIZE_MINIMUM_PIXELS:
+            # nearest neighbor has no filter support to keep cache resident
+            return _tiled_resize(pil_image, (new_nx, new_ny), self.resample)
+        return pil_image.resize((new_nx, new_ny), resample=self.resample)
 
     def decimated_image_coords_to_display_image_coords(self, decimated_image_yx_cords):
         """
@@ -222,8 +566,8 @@ class CanvasImage(object):
         List[Tuple[float, float]]
         """
 
-        scale_factor = self.compute_display_scale_factor(self.canvas_decimated_image)
-        return [(coord[0]*scale_factor, coord[1]*scale_factor) for coord in decimated_image_yx_cords]
+        scale_factor = self.display_rescaling_factor
+        return [(y*scale_factor, x*scale_factor) for y, x in decimated_image_yx_cords]
 
     def display_image_coords_to_decimated_image_coords(self, display_image_yx_coords):
         """
@@ -238,25 +582,28 @@ class CanvasImage(object):
         List[Tuple[float, float]]
         """
 
-        scale_factor = self.compute_display_scale_factor(self.canvas_decimated_image)
-        return [(coord[0]/scale_factor, coord[1]/scale_factor) for coord in display_image_yx_coords]
+        scale_factor = self.display_rescaling_factor
+        return [(y/scale_factor, x/scale_factor) for y, x in display_image_yx_coords]
 
     @staticmethod
     def display_image_coords_to_canvas_coords(display_image_yx_coords):
         """
         Converts display image coordinates to canvas coordinates. This is just a
-        axis switch operation.
+        axis switch operation. An array input of shape `(N, 2)` yields a column
+        swapped view of the array, with no copy.
 
         Parameters
         ----------
-        display_image_yx_coords : List[Tuple[float, float]]
+        display_image_yx_coords : List[Tuple[float, float]]|numpy.ndarray
 
         Returns
         -------
-        List[Tuple[float, float]]
+        List[Tuple[float, float]]|numpy.ndarray
         """
 
-        return [(yx[1], yx[0]) for yx in display_image_yx_coords]
+        if isinstance(display_image_yx_coords, numpy.ndarray):
+            return display_image_yx_coords[:, ::-1]
+        return [(x, y) for y, x in display_image_yx_coords]
 
     def compute_display_scale_factor(self, decimated_image):
         """
@@ -369,14 +716,15 @@ class CanvasImage(object):
         None
         """
 
-        if len(self.drop_bands) > 0:
-            zeros_image = numpy.zeros_like(image_data[:, :, 0])
-            for drop_band in self.drop_bands:
-                image_data[:, :, drop_band] = zeros_image
+        if len(self.drop_bands) > 0 and not image_data.flags.owndata:
+            # this may be a view of the reader data, which must not be modified
+            image_data = image_data.copy()
+        for drop_band in self.drop_bands:
+            image_data[:, :, drop_band].fill(0)
         self.canvas_decimated_image = image_data
         scale_factor = self.compute_display_scale_factor(image_data)
         self.display_rescaling_factor = scale_factor
-        self.display_image = self.get_scaled_display_data(image_data)
+        self.display_image = self.get_scaled_display_image(image_data, scale_factor=scale_factor)
 
     def get_decimation_factor_from_full_image_rect(self, full_image_rect):
         """
@@ -393,17 +741,9 @@ class CanvasImage(object):
 
         ny = full_image_rect[2] - full_image_rect[0]
         nx = full_image_rect[3] - full_image_rect[1]
-        decimation_y = numpy.ceil(ny/float(self.canvas_ny))
-        decimation_x = numpy.ceil(nx/float(self.canvas_nx))
-        decimation_factor = max(decimation_y, decimation_x)
-        decimation_factor = int(decimation_factor)
-
-        min_decimation = 1
-        max_decimation = min(int(nx-1), int(ny-1))
-
-        decimation_factor = max(min_decimation, decimation_factor)
-        decimation_factor = min(max_decimation, decimation_factor)
-        return decimation_factor
+        decimation_factor = math.ceil(max(ny/float(self.canvas_ny), nx/float(self.canvas_nx)))
+        # at least 1, and at most one less than the smaller rectangle size
+        return min(max(decimation_factor, 1), int(nx-1), int(ny-1))
 
     def get_decimation_from_canvas_rect(self, canvas_rect):
         """
@@ -452,13 +792,16 @@ class CanvasImage(object):
 
         decimation_factor = self.decimation_factor
         decimation_factor = decimation_factor/self.display_rescaling_factor
-        siz = int(len(canvas_coords)/2)
-        out = []
-        for i in range(siz):
-            out.extend(
-                (canvas_coords[2*i+1]*decimation_factor + self.canvas_full_image_upper_left_yx[0],
-                 canvas_coords[2 * i] * decimation_factor + self.canvas_full_image_upper_left_yx[1]))
-        return out
+        y_offset, x_offset = self.canvas_full_image_upper_left_yx
+        if len(canvas_coords) < 2*_VECTORIZED_COORDS_MINIMUM:
+            count = 2*(len(canvas_coords)//2)
+            out = [0.0]*count
+            for i in range(0, count, 2):
+                out[i] = canvas_coords[i+1]*decimation_factor + y_offset
+                out[i+1] = canvas_coords[i]*decimation_factor + x_offset
+            return out
+
+        return canvas_xy_to_image_yx(canvas_coords, y_offset, x_offset, decimation_factor).ravel().tolist()
 
     def canvas_rect_to_full_image_rect(self, canvas_rect):
         """
@@ -503,13 +846,35 @@ class CanvasImage(object):
         decimation_factor = self.decimation_factor
         decimation_factor = decimation_factor / self.display_rescaling_factor
 
-        siz = int(len(full_image_yx)/2)
-        out = []
-        for i in range(siz):
-            out.extend(
-                (float(full_image_yx[2*i+1] - self.canvas_full_image_upper_left_yx[1]) / decimation_factor,
-                 float(full_image_yx[2*i] - self.canvas_full_image_upper_left_yx[0]) / decimation_factor))
-        return out
+        y_offset, x_offset = self.canvas_full_image_upper_left_yx
+        if not isinstance(full_image_yx, numpy.ndarray) and len(full_image_yx) < 2*_VECTORIZED_COORDS_MINIMUM:
+            count = 2*(len(full_image_yx)//2)
+            out = [0.0]*count
+            for i in range(0, count, 2):
+                out[i] = float(full_image_yx[i+1] - x_offset) / decimation_factor
+                out[i+1] = float(full_image_yx[i] - y_offset) / decimation_factor
+            return out
+
+        return self.full_image_yx_to_canvas_xy(full_image_yx).ravel().tolist()
+
+    def full_image_yx_to_canvas_xy(self, full_image_yx):
+        """
+        Gets the canvas coordinates from full image coordinates in yx order,
+        as an array in xy order.
+
+        Parameters
+        ----------
+        full_image_yx : Tuple|List|numpy.ndarray
+
+        Returns
+        -------
+        numpy.ndarray
+            Of shape `(N, 2)`.
+        """
+
+        decimation_factor = self.decimation_factor / self.display_rescaling_factor
+        y_offset, x_offset = self.canvas_full_image_upper_left_yx
+        return image_yx_to_canvas_xy(full_image_yx, y_offset, x_offset, decimation_factor)
 
 
 class VectorObject(object):
@@ -517,6 +882,10 @@ class VectorObject(object):
     The vector object - for shapes rendered on the image canvas.
     """
 
+    __slots__ = (
+        '_type', '_uid', '_name', '_is_tool', '_color', '_text', '_image_coords', '_image_yx',
+        'image_drag_limits', 'point_size', '_regular_args', '_highlight_args')
+
     def __init__(
             self, vector_type, uid=None, name=None, is_tool=False, image_coords=None, image_drag_limits=None,
             color=None, text=None, point_size=6, regular_args=None, highlight_args=None):
@@ -550,6 +919,8 @@ class VectorObject(object):
         self._uid = None
         self._name = name
         self._text = None
+        self._image_coords = None
+        self._image_yx = None
 
         vector_type = ShapeTypeConstants.validate(vector_type)
         if vector_type is None:
@@ -606,17 +977,7 @@ class VectorObject(object):
                 self.highlight_args['width'] = self.regular_args['width'] + 2
 
         # perform color validation
-        if self._type in [
-                ShapeTypeConstants.LINE, ShapeTypeConstants.ARROW,
-                ShapeTypeConstants.POINT, ShapeTypeConstants.TEXT]:
-            attr = 'fill'
-        elif self._type in [
-                ShapeTypeConstants.RECT, ShapeTypeConstants.POLYGON,
-                ShapeTypeConstants.ELLIPSE]:
-            attr = 'outline'
-        else:
-            attr = None
-
+        attr = _COLOR_OPTION_KEYS.get(self._type, None)
         if attr is not None:
             if attr in self.regular_args:
                 self.color = self.regular_args[attr]
@@ -707,6 +1068,35 @@ class VectorObject(object):
         else:
             self._text = str(value)
 
+    @property
+    def image_coords(self):
+        """
+        None|Tuple: The flat image coordinates, of the form `(y0, x0, y1, x1, ...)`.
+        """
+
+        return self._image_coords
+
+    @image_coords.setter
+    def image_coords(self, value):
+        if value is not None and not isinstance(value, tuple):
+            value = tuple(value)
+        self._image_coords = value
+        self._image_yx = None
+
+    @property
+    def image_yx(self):
+        """
+        None|numpy.ndarray: The (read-only) image coordinates as an array of
+        shape `(N, 2)`, in yx order. This is constructed on first request, and
+        discarded whenever the image coordinates are set.
+        """
+
+        if self._image_yx is None and self._image_coords is not None:
+            image_yx = numpy.array(self._image_coords, dtype='float64').reshape((-1, 2))
+            image_yx.flags.writeable = False
+            self._image_yx = image_yx
+        return self._image_yx
+
     @property
     def regular_args(self):
         """
@@ -740,6 +1130,99 @@ class VectorObject(object):
             regular_args=self.regular_args.copy(), highlight_args=self.highlight_args.copy())
 
 
+class _ShapeSegmentCache(object):
+    """
+    The outline line segments, in canvas coordinates, for all non-tool shapes
+    stored as contiguous arrays for closest shape queries. The segments for
+    `shape_ids[i]` are given by the slice `offsets[i]:offsets[i+1]`.
+
+    The segment coordinates are stored as `float32`, which is ample precision
+    for canvas pixel distances and halves the memory scanned by each query.
+    """
+
+    __slots__ = ('shape_ids', 'starts', 'ends', 'offsets', '_indices', '_tree')
+
+    def __init__(self, shape_ids, outlines):
+        """
+
+        Parameters
+        ----------
+        shape_ids : List[int]
+        outlines : List[numpy.ndarray]
+            The outline vertices for each shape, each of shape `(N, 2)`.
+        """
+
+        self._tree = None
+        self._indices = {the_id: i for i, the_id in enumerate(shape_ids)}
+        self.shape_ids = numpy.array(shape_ids, dtype='int64')
+        if len(outlines) == 0:
+            self.starts = numpy.zeros((0, 2), dtype='float32')
+            self.ends = numpy.zeros((0, 2), dtype='float32')
+            self.offsets = numpy.zeros((1, ), dtype='int64')
+            return
+
+        # single vertex outlines are represented as one degenerate segment
+        self.starts = numpy.concatenate(
+            [outline[:-1, :] if outline.shape[0] > 1 else outline for outline in outlines],
+            axis=0).astype('float32')
+        self.ends = numpy.concatenate(
+            [outline[1:, :] if outline.shape[0] > 1 else outline for outline in outlines],
+            axis=0).astype('float32')
+        self.offsets = numpy.cumsum(
+            [0, ] + [max(1, outline.shape[0] - 1) for outline in outlines], dtype='int64')
+
+    def shape_distance(self, shape_id, point):
+        """
+        Gets the distance from the point to the outline of the given shape.
+
+        Parameters
+        ----------
+        shape_id : int
+        point : Tuple
+
+        Returns
+        -------
+        None|float
+            `None` if the shape is not in the cache.
+        """
+
+        index = self._indices.get(shape_id, None)
+        if index is None:
+            return None
+        point = numpy.array(point, dtype='float32')
+        start, end = self.offsets[index], self.offsets[index+1]
+        return float(numpy.sqrt(numpy.min(
+            segment_squared_distances(self.starts[start:end], self.ends[start:end], point))))
+
+    def closest_shape(self, point, threshold):
+        """
+        Finds the first shape within the threshold distance of the point, if
+        any, otherwise the closest shape. This requires at least one shape.
+
+        Parameters
+        ----------
+        point : Tuple
+        threshold : int|float
+
+        Returns
+        -------
+        shape_id : int
+        distance : float
+        """
+
+        point = numpy.array(point, dtype='float32')
+        if self.starts.shape[0] < _SEGMENT_TREE_THRESHOLD:
+            index, distance = closest_segment_group(
+                self.starts, self.ends, self.offsets, point, threshold=threshold)
+        else:
+            if self._tree is None:
+                # only constructed once it is actually queried
+                self._tree = SegmentTree(self.starts, self.ends)
+            index, distance = self._tree.closest_segment_group(
+                self.starts, self.ends, self.offsets, point, threshold=threshold)
+        return int(self.shape_ids[index]), distance
+
+
 ########
 # component variables containers
 
@@ -779,6 +1262,15 @@ class CanvasConfig(object):
     mouse_zoom_ratio = FloatDescriptor(
         'mouse_zoom_ratio', default_value=1.1,
         docstring='The zoom ratio per mouse zoom event')  # type: float
+    resample_method = IntegerDescriptor(
+        'resample_method', default_value=Image.BILINEAR,
+        docstring='The PIL resampling filter for rescaling the image data '
+                  'for display.')  # type: int
+    interactive_resample_method = IntegerDescriptor(
+        'interactive_resample_method', default_value=Image.NEAREST,
+        docstring='The PIL resampling filter for rescaling the image data '
+                  'for display during interactive operations, like '
+                  'panning.')  # type: int
 
 
 class CanvasState(object):
@@ -864,10 +1356,15 @@ class AppVariables(object):
         self.config = CanvasConfig()
         self.state = CanvasState()
 
-        self._shape_ids = []  # non-tool associated shape ids
+        # non-tool associated shape ids, as insertion ordered dictionary keys
+        #   for constant time removal, and the list is only rebuilt on demand
+        self._shape_id_order = {}
+        self._shape_ids = []
+        self._shape_ids_by_type = {}  # non-tool shape ids, bucketed by shape type
         self._tool_shape_ids = []  # tool associated shape ids
+        self._tool_shape_id_set = set()  # for constant time membership checks
         self._tool_shape_ids_by_name = {}
-        self._vector_objects = OrderedDict()
+        self._vector_objects = {}
         self._remap_function = get_remap_list()[0][1]
         self._tools = {}
 
@@ -886,6 +1383,8 @@ class AppVariables(object):
         List[int]: The list of shape ids. This should not be manipulated directly.
         """
 
+        if self._shape_ids is None:
+            self._shape_ids = list(self._shape_id_order)
         return self._shape_ids
 
     @property
@@ -898,6 +1397,37 @@ class AppVariables(object):
 
         return self._tool_shape_ids
 
+    def get_shape_ids_by_type(self, shape_type):
+        """
+        Gets the (non-tool) shape ids of the given shape type, in the order
+        of creation.
+
+        Parameters
+        ----------
+        shape_type : int
+
+        Returns
+        -------
+        List[int]
+        """
+
+        return list(self._shape_ids_by_type.get(shape_type, ()))
+
+    def is_tool_shape_id(self, the_id):
+        """
+        Is the given shape id associated with a tool?
+
+        Parameters
+        ----------
+        the_id : None|int
+
+        Returns
+        -------
+        bool
+        """
+
+        return the_id in self._tool_shape_id_set
+
     @property
     def vector_objects(self):
         # type: () -> Dict[int, VectorObject]
@@ -928,9 +1458,13 @@ class AppVariables(object):
                         vector_object.name))
             self._tool_shape_ids_by_name[vector_object.name] = vector_object.uid
             self._tool_shape_ids.append(vector_object.uid)
+            self._tool_shape_id_set.add(vector_object.uid)
         else:
-            if vector_object.uid not in self._shape_ids:
-                self._shape_ids.append(vector_object.uid)
+            if vector_object.uid not in self._shape_id_order:
+                self._shape_id_order[vector_object.uid] = None
+                self._shape_ids_by_type.setdefault(vector_object.type, {})[vector_object.uid] = None
+                if self._shape_ids is not None:
+                    self._shape_ids.append(vector_object.uid)
 
     def remove_shape_from_tracking(self, the_id):
         """
@@ -953,11 +1487,14 @@ class AppVariables(object):
         vector_object = self._vector_objects[the_id]
         if vector_object.is_tool:
             self._tool_shape_ids.remove(vector_object.uid)
+            self._tool_shape_id_set.discard(vector_object.uid)
             del self._tool_shape_ids_by_name[vector_object.name]
         else:
             try:
-                self._shape_ids.remove(vector_object.uid)
-            except ValueError:
+                del self._shape_id_order[vector_object.uid]
+                del self._shape_ids_by_type[vector_object.type][vector_object.uid]
+                self._shape_ids = None
+            except KeyError:
                 logger.error(
                     'The regular shape id `{}` is not registered,\n\t'
                     'there may be inconsistent shape state on the image canvas'.format(vector_object.uid))
@@ -1098,6 +1635,17 @@ class ImageCanvas(Canvas):
         # for properties of image canvas
         self._new_shape_type = ShapeTypeConstants.POLYGON
         self._current_shape_id = None
+        self._shape_segment_cache = None  # type: Union[None, _ShapeSegmentCache]
+        self._tk_im_key = None  # type: Union[None, Tuple[str, Tuple[int, int]]]
+        self._animation_after_id = None  # type: Union[None, str]
+        # the most recent unprocessed motion event, as (tool method name, event)
+        self._pending_motion = None  # type: Union[None, Tuple[str, object]]
+        self._motion_after_id = None  # type: Union[None, str]
+        self._motion_bound = False
+        # results of background image loads, as (load number, canvas image or exception)
+        self._image_load_queue = queue.Queue()
+        self._image_load_count = 0
+        self._image_load_after_id = None  # type: Union[None, str]
 
         Canvas.__init__(self, master, highlightthickness=0)
         self.pack(fill=tkinter.BOTH, expand=tkinter.NO)
@@ -1113,7 +1661,7 @@ class ImageCanvas(Canvas):
         self.on_right_mouse_double_click(self.callback_handle_right_mouse_double_click)
         self.on_left_mouse_release(self.callback_handle_left_mouse_release)
         self.on_right_mouse_release(self.callback_handle_right_mouse_release)
-        self.on_mouse_motion(self.callback_handle_mouse_motion)
+        self._update_motion_binding()
         self.on_left_mouse_motion(self.callback_handle_left_mouse_motion)
         self.on_right_mouse_motion(self.callback_handle_right_mouse_motion)
         self.on_mouse_wheel(self.callback_handle_mouse_wheel)
@@ -1170,9 +1718,11 @@ class ImageCanvas(Canvas):
 
         tool_change = (old_tool != value)
         if tool_change and old_tool is not None:
+            self.flush_pending_motion()
             old_tool.finalize_tool()
         self._current_tool = value
         value.initialize_tool(**kwargs)
+        self._update_motion_binding()
         if tool_change:
             self.emit_current_tool_changed()
 
@@ -1180,6 +1730,26 @@ class ImageCanvas(Canvas):
     def current_tool(self, value):
         self.set_current_tool(value)
 
+    def _update_motion_binding(self):
+        """
+        Binds the (no button) mouse motion callback only if the current tool
+        handles mouse motion, so that no callback runs while simply hovering
+        over the canvas otherwise.
+
+        Returns
+        -------
+        None
+        """
+
+        handles_motion = (type(self._current_tool).on_mouse_motion is not ImageCanvasTool.on_mouse_motion)
+        if handles_motion == self._motion_bound:
+            return
+        if handles_motion:
+            self.on_mouse_motion(self.callback_handle_mouse_motion)
+        else:
+            self.unbind('<Motion>')
+        self._motion_bound = handles_motion
+
     @property
     def new_shape_type(self):
         """
@@ -1267,19 +1837,36 @@ class ImageCanvas(Canvas):
 
         self.variables.state.foreground_color = self.color_cycler.next_color
 
-    def _reinitialize_reader(self):
+    def _reinitialize_reader(self, clear_cache=True, display_ready=False):
         """
         Re-initializes image view, based on an image reader change, or change in image index.
 
+        Parameters
+        ----------
+        clear_cache : bool
+            Clear the decimated tile cache? This is unnecessary for a newly
+            constructed canvas image.
+        display_ready : bool
+            Does the canvas image object already hold the display of the full
+            image, for the current canvas size? If so, it is installed directly,
+            rather than read and resized again.
+
         Returns
         -------
         None
         """
 
+        if clear_cache:
+            self.variables.canvas_image_object.clear_tile_cache()
         self.reinitialize_shapes()
         full_ny = self.image_reader.full_image_ny
         full_nx = self.image_reader.full_image_nx
-        self.zoom_to_full_image_selection([0, 0, full_ny, full_nx])
+        if display_ready:
+            self._set_image_from_pil_image(self.variables.canvas_image_object.display_pil_image)
+            self.redraw_all_shapes()
+            self.emit_image_extent_changed()
+        else:
+            self.zoom_to_full_image_selection([0, 0, full_ny, full_nx])
         self.current_tool = 'VIEW'
         # update drag limits for the tools
         for tool_id in self.variables.tool_shape_ids:
@@ -1299,12 +1886,119 @@ class ImageCanvas(Canvas):
         None
         """
 
+        self._cancel_image_load()
+        # set the remap first, so the initial display is read only once
+        image_reader.set_remap_type(self.variables.remap_function)
         self.variables.canvas_image_object = CanvasImage(
-            image_reader, self.variables.state.canvas_width, self.variables.state.canvas_height)
-        # set the remap
-        self.image_reader.set_remap_type(self.variables.remap_function)
-        # update the canvas elements
-        self._reinitialize_reader()
+            image_reader, self.variables.state.canvas_width, self.variables.state.canvas_height,
+            resample=self.variables.config.resample_method)
+        # update the canvas elements, using the display constructed above
+        self._reinitialize_reader(clear_cache=False, display_ready=True)
+
+    def _cancel_image_load(self):
+        """
+        Supersedes any background image load in progress, so that its result
+        is discarded.
+
+        Returns
+        -------
+        None
+        """
+
+        self._image_load_count += 1
+        if self._image_load_after_id is not None:
+            self.after_cancel(self._image_load_after_id)
+            self._image_load_after_id = None
+
+    def set_image_reader_in_background(self, image_reader, poll_interval=50):
+        """
+        Set the image reader, with the (possibly slow) initial reading and
+        display image construction performed in a background thread, so that
+        the GUI remains responsive. The canvas is updated once the load is
+        complete, and only the most recently requested load is applied. A
+        failed load is logged, and the current image is left in place.
+
+        Parameters
+        ----------
+        image_reader : CanvasImageReader
+        poll_interval : int
+            The interval in milliseconds for checking on the load.
+
+        Returns
+        -------
+        None
+        """
+
+        image_reader.set_remap_type(self.variables.remap_function)
+        self._image_load_count += 1
+        thread = threading.Thread(
+            target=self._load_canvas_image,
+            args=(self._image_load_count, image_reader, self.variables.state.canvas_width,
+                  self.variables.state.canvas_height, self.variables.config.resample_method),
+            daemon=True)
+        thread.start()
+        if self._image_load_after_id is None:
+            self._image_load_after_id = self.after(poll_interval, self._poll_image_load, poll_interval)
+
+    def _load_canvas_image(self, load_number, image_reader, canvas_nx, canvas_ny, resample):
+        """
+        Constructs the canvas image, for use in a background thread. This must
+        not touch any tkinter elements.
+
+        Parameters
+        ----------
+        load_number : int
+        image_reader : CanvasImageReader
+        canvas_nx : int
+        canvas_ny : int
+        resample : int
+        """
+
+        # noinspection PyBroadException
+        try:
+            result = CanvasImage(image_reader, canvas_nx, canvas_ny, resample=resample)
+        except Exception as e:
+            result = e
+        self._image_load_queue.put((load_number, result))
+
+    def _poll_image_load(self, poll_interval):
+        """
+        Checks for completed background image loads, and applies the most
+        recently requested one.
+
+        Parameters
+        ----------
+        poll_interval : int
+        """
+
+        self._image_load_after_id = None
+        result = None
+        while True:
+            try:
+                load_number, the_result = self._image_load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if load_number == self._image_load_count:
+                result = the_result
+
+        if result is None:
+            self._image_load_after_id = self.after(poll_interval, self._poll_image_load, poll_interval)
+            return
+        if isinstance(result, Exception):
+            # this is a Tk callback, so the exception can not reach the caller,
+            #   and the current image is left in place
+            logger.error('Background image reader load failed with {}'.format(result), exc_info=result)
+            return
+
+        width = self.variables.state.canvas_width
+        height = self.variables.state.canvas_height
+        display_ready = (result.canvas_nx == width and result.canvas_ny == height)
+        if not display_ready:
+            # the canvas was resized during the load, so the display must be redone
+            result.canvas_nx = width
+            result.canvas_ny = height
+        self.variables.canvas_image_object = result
+        self._reinitialize_reader(clear_cache=False, display_ready=display_ready)
 
     def get_base_reader(self):
         """
@@ -1439,9 +2133,12 @@ class ImageCanvas(Canvas):
         """
 
         current_id = self._current_shape_id
-        if current_id is None or current_id in self.get_tool_shape_ids():
+        if current_id is None:
             return None
-        return self.get_vector_object(current_id)
+        variables = self.variables
+        if variables.is_tool_shape_id(current_id):
+            return None
+        return variables.vector_objects.get(current_id, None)
 
     def get_non_tool_shape_ids(self):
         """
@@ -1454,6 +2151,23 @@ class ImageCanvas(Canvas):
 
         return self.variables.shape_ids
 
+    def get_shape_ids_by_type(self, shape_type):
+        """
+        Gets the shape ids, excluding shapes assigned to tools, of the given
+        shape type.
+
+        Parameters
+        ----------
+        shape_type : int|str
+            See ShapeTypeConstants for the enumeration.
+
+        Returns
+        -------
+        List[int]
+        """
+
+        return self.variables.get_shape_ids_by_type(ShapeTypeConstants.validate(shape_type))
+
     def get_tool_shape_ids(self):
         """
         Gets the shape ids for the shapes assigned to tools, such as the zoom
@@ -1466,6 +2180,22 @@ class ImageCanvas(Canvas):
 
         return self.variables.tool_shape_ids
 
+    def is_tool_shape_id(self, shape_id):
+        """
+        Is the given shape id associated with a tool, such as the zoom or
+        selection shapes?
+
+        Parameters
+        ----------
+        shape_id : None|int
+
+        Returns
+        -------
+        bool
+        """
+
+        return self.variables.is_tool_shape_id(shape_id)
+
     def callback_handle_resize(self, event):
         """
         Handle a resize event.
@@ -1539,6 +2269,60 @@ class ImageCanvas(Canvas):
         self.emit_remap_changed()
 
     # mouse event callbacks
+    def _schedule_motion(self, method_name, event):
+        """
+        Records the motion event for handling by the current tool once the
+        pending events have been processed, so that a burst of motion events
+        is handled only once, for the most recent position.
+
+        Parameters
+        ----------
+        method_name : str
+            The name of the tool method handling the event.
+        event
+
+        Returns
+        -------
+        None
+        """
+
+        if self._pending_motion is not None and self._pending_motion[0] != method_name:
+            self.flush_pending_motion()
+        self._pending_motion = (method_name, event)
+        if self._motion_after_id is None:
+            self._motion_after_id = self.after_idle(self._process_pending_motion)
+
+    def _process_pending_motion(self):
+        """
+        Handles the pending motion event, if any.
+
+        Returns
+        -------
+        None
+        """
+
+        self._motion_after_id = None
+        pending = self._pending_motion
+        if pending is None:
+            return
+        self._pending_motion = None
+        method_name, event = pending
+        getattr(self.current_tool, method_name)(event)
+
+    def flush_pending_motion(self):
+        """
+        Immediately handles any pending motion event. This is performed before
+        handling any other mouse event, to maintain the event order.
+
+        Returns
+        -------
+        None
+        """
+
+        if self._motion_after_id is not None:
+            self.after_cancel(self._motion_after_id)
+        self._process_pending_motion()
+
     def callback_handle_left_mouse_click(self, event):
         """
         Left mouse click callback.
@@ -1552,6 +2336,7 @@ class ImageCanvas(Canvas):
         None
         """
 
+        self.flush_pending_motion()
         self.current_tool.on_left_mouse_click(event)
 
     def callback_handle_right_mouse_click(self, event):
@@ -1567,6 +2352,7 @@ class ImageCanvas(Canvas):
         None
         """
 
+        self.flush_pending_motion()
         self.current_tool.on_right_mouse_click(event)
 
     def callback_handle_left_mouse_double_click(self, event):
@@ -1582,6 +2368,7 @@ class ImageCanvas(Canvas):
         None
         """
 
+        self.flush_pending_motion()
         self.current_tool.on_left_mouse_double_click(event)
 
     def callback_handle_right_mouse_double_click(self, event):
@@ -1597,6 +2384,7 @@ class ImageCanvas(Canvas):
         None
         """
 
+        self.flush_pending_motion()
         self.current_tool.on_right_mouse_double_click(event)
 
     def callback_handle_left_mouse_release(self, event):
@@ -1612,6 +2400,7 @@ class ImageCanvas(Canvas):
         None
         """
 
+        self.flush_pending_motion()
         self.current_tool.on_left_mouse_release(event)
 
     def callback_handle_right_mouse_release(self, event):
@@ -1627,6 +2416,7 @@ class ImageCanvas(Canvas):
         None
         """
 
+        self.flush_pending_motion()
         self.current_tool.on_right_mouse_release(event)
 
     def callback_handle_mouse_motion(self, event):
@@ -1642,7 +2432,7 @@ class ImageCanvas(Canvas):
         None
         """
 
-        self.current_tool.on_mouse_motion(event)
+        self._schedule_motion('on_mouse_motion', event)
 
     def callback_handle_left_mouse_motion(self, event):
         """
@@ -1657,7 +2447,7 @@ class ImageCanvas(Canvas):
         None
         """
 
-        self.current_tool.on_left_mouse_motion(event)
+        self._schedule_motion('on_left_mouse_motion', event)
 
     def callback_handle_right_mouse_motion(self, event):
         """
@@ -1687,6 +2477,7 @@ class ImageCanvas(Canvas):
         None
         """
 
+        self.flush_pending_motion()
         self.current_tool.on_mouse_wheel(event)
 
     def callback_handle_shift_mouse_wheel(self, event):
@@ -1702,6 +2493,7 @@ class ImageCanvas(Canvas):
         None
         """
 
+        self.flush_pending_motion()
         self.current_tool.on_shift_mouse_wheel(event)
 
     def callback_handle_mouse_enter(self, event):
@@ -1737,8 +2529,7 @@ class ImageCanvas(Canvas):
     # image properties and manipulation
     def set_image_from_numpy_array(self, numpy_data):
         """
-        This is the default way to set and display image data.  All other methods
-        to update images should ultimately call this.
+        This is the default way to set and display image data from an array.
 
         Parameters
         ----------
@@ -1752,6 +2543,91 @@ class ImageCanvas(Canvas):
         pil_image = Image.fromarray(numpy_data)
         self._set_image_from_pil_image(pil_image)
 
+    def animate_with_numpy_frame_sequence(self, numpy_frame_sequence, frames_per_second=15):
+        """
+        Animate with a sequence of numpy arrays. The frames are displayed from
+        Tk `after` callbacks, so this returns immediately and the event loop
+        continues to run during the animation.
+
+        Parameters
+        ----------
+        numpy_frame_sequence : Sequence[numpy.ndarray]
+        frames_per_second : float|int
+
+        Returns
+        -------
+        None
+        """
+
+        self._animate(numpy_frame_sequence, frames_per_second, self.set_image_from_numpy_array)
+
+    def animate_with_pil_frame_sequence(self, pil_frame_sequence, frames_per_second=15):
+        """
+        Animate with a sequence of PIL images. The frames are displayed from
+        Tk `after` callbacks, so this returns immediately and the event loop
+        continues to run during the animation.
+
+        Parameters
+        ----------
+        pil_frame_sequence : Sequence[Image.Image]
+        frames_per_second : float|int
+
+        Returns
+        -------
+        None
+        """
+
+        self._animate(pil_frame_sequence, frames_per_second, self._set_image_from_pil_image)
+
+    def stop_animation(self):
+        """
+        Stops any animation in progress.
+
+        Returns
+        -------
+        None
+        """
+
+        if self._animation_after_id is not None:
+            self.after_cancel(self._animation_after_id)
+            self._animation_after_id = None
+
+    def _animate(self, frame_sequence, frames_per_second, set_frame):
+        """
+        Schedules the display of each frame against a monotonic clock, so that
+        the frame cadence does not drift.
+
+        Parameters
+        ----------
+        frame_sequence : Sequence
+        frames_per_second : float|int
+        set_frame : callable
+            Displays a single frame.
+
+        Returns
+        -------
+        None
+        """
+
+        if frames_per_second <= 0:
+            raise ValueError('frames_per_second must be positive, got {}'.format(frames_per_second))
+        self.stop_animation()
+        frame_period = 1./frames_per_second
+        frames = iter(frame_sequence)
+
+        def next_frame(deadline):
+            try:
+                frame = next(frames)
+            except StopIteration:
+                self._animation_after_id = None
+                return
+            set_frame(frame)
+            deadline += frame_period
+            delay = max(0, int(round((deadline - time.monotonic())*1000)))
+            self._animation_after_id = self.after(delay, next_frame, deadline)
+
+        next_frame(time.monotonic())
+
     def set_canvas_size(self, width_npix, height_npix):
         """
         Set the canvas size.
@@ -1791,21 +2667,16 @@ class ImageCanvas(Canvas):
         if image_coords is None or image_coords[0] == image_coords[2] or image_coords[1] == image_coords[3]:
             return None
 
-        tmp_image_coords = list(image_coords)
-        if image_coords[0] > image_coords[2]:
-            tmp_image_coords[0] = image_coords[2]
-            tmp_image_coords[2] = image_coords[0]
-        if image_coords[1] > image_coords[3]:
-            tmp_image_coords[1] = image_coords[3]
-            tmp_image_coords[3] = image_coords[1]
+        y0, x0, y1, x1 = image_coords[:4]
+        if y0 > y1:
+            y0, y1 = y1, y0
+        if x0 > x1:
+            x0, x1 = x1, x0
+        canvas_image_object = self.variables.canvas_image_object
         if decimation is None:
-            decimation = self.variables.canvas_image_object.get_decimation_factor_from_full_image_rect(tmp_image_coords)
-        tmp_image_coords = (
-            int(tmp_image_coords[0]), int(tmp_image_coords[1]),
-            int(tmp_image_coords[2]), int(tmp_image_coords[3]))
-        image_data_in_rect = self.variables.canvas_image_object.get_decimated_image_data_in_full_image_rect(
-            tmp_image_coords, decimation)
-        return image_data_in_rect
+            decimation = canvas_image_object.get_decimation_factor_from_full_image_rect((y0, x0, y1, x1))
+        return canvas_image_object.get_decimated_image_data_in_full_image_rect(
+            (int(y0), int(x0), int(y1), int(x1)), decimation)
 
     def zoom_to_canvas_selection(self, canvas_rect):
         """
@@ -1841,69 +2712,53 @@ class ImageCanvas(Canvas):
         """
 
         # what is the aspect ratio of the zoom rectangle?
-        zoom_height = image_rect[2] - image_rect[0]
-        zoom_width = image_rect[3] - image_rect[1]
-        if zoom_height < 0:
-            temp_image_rect = copy.deepcopy(image_rect)
-            temp_image_rect[0] = image_rect[2]
-            temp_image_rect[2] = image_rect[0]
-            zoom_height *= -1
-            image_rect = temp_image_rect
-        if zoom_width < 0:
-            temp_image_rect = copy.deepcopy(image_rect)
-            temp_image_rect[1] = image_rect[3]
-            temp_image_rect[3] = image_rect[1]
-            zoom_width *= -1
-            image_rect = temp_image_rect
+        y_min, y_max = min(image_rect[0], image_rect[2]), max(image_rect[0], image_rect[2])
+        x_min, x_max = min(image_rect[1], image_rect[3]), max(image_rect[1], image_rect[3])
+        image_rect = (y_min, x_min, y_max, x_max)
+        zoom_height = y_max - y_min
+        zoom_width = x_max - x_min
 
         # validate that our sizes make sense
         if zoom_width <= 0 or zoom_height <= 0:
             showinfo('Poorly defined zoom rectangle', message='Zoom rectangle {}. Aborting zoom.'.format(image_rect))
             return  # do nothing
-        if zoom_height < self.variables.config.zoom_pixel_threshold or \
-                zoom_width < self.variables.config.zoom_pixel_threshold:
+        zoom_pixel_threshold = self.variables.config.zoom_pixel_threshold
+        if zoom_height < zoom_pixel_threshold or zoom_width < zoom_pixel_threshold:
             # do not perform this zoom
             return
         zoom_ratio = zoom_height/float(zoom_width)
 
         # what is the aspect ratio of the canvas?
-        window_height = self.variables.canvas_image_object.canvas_ny
-        window_width = self.variables.canvas_image_object.canvas_nx
+        canvas_image_object = self.variables.canvas_image_object
+        image_reader = canvas_image_object.image_reader
+        window_height = canvas_image_object.canvas_ny
+        window_width = canvas_image_object.canvas_nx
         window_ratio = window_height/float(window_width)
 
         # craft an image rectangle containing the input rectangle, of the same ratio as the window rectangle
         if zoom_ratio >= window_ratio:
             # the zoom rectangle is taller than the window rectangle.
             # Keep the height, and extend the width
-            image_rect = [
-                image_rect[0], image_rect[1],
-                image_rect[2], image_rect[1] + zoom_width*zoom_ratio/window_ratio]
+            x_max = x_min + zoom_width*zoom_ratio/window_ratio
         else:
             # the zoom rectangle is longer than the window rectangle
             # Keep the width, and expand the height
-            image_rect = [
-                image_rect[0], image_rect[1],
-                image_rect[0] + zoom_height*window_ratio/zoom_ratio, image_rect[3]]
+            y_max = y_min + zoom_height*window_ratio/zoom_ratio
 
         # ensure that sensible limits apply
-        if image_rect[0] < 0:
-            image_rect[0] = 0
-        if image_rect[1] < 0:
-            image_rect[1] = 0
-        if image_rect[2] > self.image_reader.full_image_ny:
-            image_rect[2] = self.image_reader.full_image_ny
-        if image_rect[3] > self.image_reader.full_image_nx:
-            image_rect[3] = self.image_reader.full_image_nx
-
-        self.variables.canvas_image_object.update_canvas_display_image_from_full_image_rect(
+        image_rect = (
+            max(y_min, 0), max(x_min, 0),
+            min(y_max, image_reader.full_image_ny), min(x_max, image_reader.full_image_nx))
+
+        canvas_image_object.update_canvas_display_image_from_full_image_rect(
             image_rect, decimation=decimation)
-        self.set_image_from_numpy_array(self.variables.canvas_image_object.display_image)
+        self._set_image_from_pil_image(canvas_image_object.display_pil_image)
         self.redraw_all_shapes()
         self.emit_image_extent_changed()
 
     def update_current_image(self):
         """
-        Updates the current image.
+        Updates the current image, re-reading the data from the image reader.
 
         Returns
         -------
@@ -1911,14 +2766,19 @@ class ImageCanvas(Canvas):
         """
 
         if self.variables.canvas_image_object is not None:
+            # the reader data, remap or index may have changed
+            self.variables.canvas_image_object.clear_tile_cache()
             rect = (0, 0, self.variables.state.canvas_width, self.variables.state.canvas_height)
             self.variables.canvas_image_object.update_canvas_display_image_from_canvas_rect(rect)
-            self.set_image_from_numpy_array(self.variables.canvas_image_object.display_image)
-            self.update()
+            self._invalidate_shape_segment_cache()
+            self._set_image_from_pil_image(self.variables.canvas_image_object.display_pil_image)
+            # only flush the redraw, rather than re-entering the whole event loop
+            self.update_idletasks()
 
     def _set_image_from_pil_image(self, pil_image):
         """
-        Set image from a PIL image.
+        Set image from a PIL image. The existing photo image and canvas image
+        item are reused when the mode and size are unchanged.
 
         Parameters
         ----------
@@ -1929,8 +2789,18 @@ class ImageCanvas(Canvas):
         None
         """
 
+        the_key = (pil_image.mode, pil_image.size)
+        if self.variables.tk_im is not None and self.variables.image_id is not None and \
+                the_key == self._tk_im_key:
+            self.variables.tk_im.paste(pil_image)
+            return
+
         self.variables.tk_im = ImageTk.PhotoImage(pil_image)
-        self.variables.image_id = self.create_image(0, 0, anchor="nw", image=self.variables.tk_im)
+        self._tk_im_key = the_key
+        if self.variables.image_id is None:
+            self.variables.image_id = self.create_image(0, 0, anchor="nw", image=self.variables.tk_im)
+        else:
+            self.itemconfigure(self.variables.image_id, image=self.variables.tk_im)
         self.tag_lower(self.variables.image_id)
 
     def zoom_on_mouse(self, event):
@@ -1947,7 +2817,8 @@ class ImageCanvas(Canvas):
         if not self.variables.zoom_on_mouse_wheel:
             return
 
-        ratio = self.variables.config.mouse_zoom_ratio
+        config = self.variables.config
+        ratio = config.mouse_zoom_ratio
         side_width = self.variables.state.canvas_width
         side_height = self.variables.state.canvas_height
 
@@ -1959,8 +2830,8 @@ class ImageCanvas(Canvas):
 
         if event.num == 5 or event.delta < 0:
             # zooming in
-            if pixel_row <= self.variables.config.zoom_pixel_threshold or \
-                    pixel_col <= self.variables.config.zoom_pixel_threshold:
+            if pixel_row <= config.zoom_pixel_threshold or \
+                    pixel_col <= config.zoom_pixel_threshold:
                 return  # no need to zoom in any further
 
             fraction = 1/ratio
@@ -1974,13 +2845,14 @@ class ImageCanvas(Canvas):
         else:
             return
 
-        x = self.canvasx(event.x)
-        y = self.canvasy(event.y)
+        # the box scaled by fraction about the mouse location
+        x_start = self.canvasx(event.x)*(1-fraction)
+        y_start = self.canvasy(event.y)*(1-fraction)
         zoom_box = (
-            x*(1-fraction),
-            y*(1-fraction),
-            x*(1-fraction) + side_width*fraction,
-            y*(1-fraction) + side_height*fraction)
+            x_start,
+            y_start,
+            x_start + side_width*fraction,
+            y_start + side_height*fraction)
         self.zoom_to_canvas_selection(zoom_box)
 
     # shape analytics methods
@@ -2024,6 +2896,43 @@ class ImageCanvas(Canvas):
         with open(output_fname, 'wb') as fi:
             fi.write(ps.encode('utf-8'))
 
+    def save_currently_displayed_canvas_to_numpy_array(self, use_postscript=False):
+        """
+        Gets the currently displayed canvas contents, including any shapes,
+        as a numpy array.
+
+        Parameters
+        ----------
+        use_postscript : bool
+            If `False`, the canvas pixels are captured directly from the screen,
+            which requires that the canvas is currently visible and unobstructed.
+            If `True`, the canvas is rendered via postscript, which works for
+            a hidden canvas, but is much slower and requires ghostscript.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        width = self.winfo_width()
+        height = self.winfo_height()
+        if not use_postscript:
+            x = self.winfo_rootx()
+            y = self.winfo_rooty()
+            from PIL import ImageGrab
+            return numpy.asarray(ImageGrab.grab(bbox=(x, y, x + width, y + height)))
+
+        ps = self.postscript(colormode='color')
+        img = Image.open(io.BytesIO(ps.encode('utf-8')))
+        # render at the smallest integer scale covering the displayed size
+        native_width, native_height = img.size
+        scale = max(1, int(numpy.ceil(max(width/float(native_width), height/float(native_height)))))
+        img.load(scale=scale)
+        if img.size != (width, height):
+            # this is only ever a downsample
+            img = img.resize((width, height), resample=Image.BOX)
+        return numpy.asarray(img)
+
     def find_distance_from_shape(self, shape_id, canvas_x, canvas_y):
         """
         Gets the distance between the given shape and point.
@@ -2039,6 +2948,12 @@ class ImageCanvas(Canvas):
         float
         """
 
+        if not self.is_tool_shape_id(shape_id):
+            # use the same cached outline as the closest shape search
+            the_distance = self._get_shape_segment_cache().shape_distance(shape_id, (canvas_x, canvas_y))
+            if the_distance is not None:
+                return the_distance
+
         geometry_obj = self.get_geometry_for_shape(shape_id, coordinate_type='canvas')
         if geometry_obj is None:
             return float('inf')
@@ -2079,17 +2994,39 @@ class ImageCanvas(Canvas):
         if min_threshold is None:
             min_threshold = self.variables.config.shape_selector_pixel_threshold
 
-        closest_distance = float('inf')
-        closest_id = None
+        cache = self._get_shape_segment_cache()
+        if cache.shape_ids.size == 0:
+            return None, float('inf')
+
+        return cache.closest_shape((canvas_x, canvas_y), min_threshold)
+
+    def _invalidate_shape_segment_cache(self):
+        """
+        Marks the cached shape segments as stale. This should be called whenever
+        any shape is created, modified, or deleted, or the canvas view changes.
+        """
+
+        self._shape_segment_cache = None
+
+    def _get_shape_segment_cache(self):
+        """
+        Gets the cached canvas coordinate outline segments for all non-tool shapes,
+        rebuilding them if the cache is stale.
 
-        for shape_id in self.get_non_tool_shape_ids():
-            the_distance = self.find_distance_from_shape(shape_id, canvas_x, canvas_y)
-            if the_distance <= min_threshold:
-                return shape_id, the_distance
-            if the_distance < closest_distance:
-                closest_distance = the_distance
-                closest_id = shape_id
-        return closest_id, closest_distance
+        Returns
+        -------
+        _ShapeSegmentCache
+        """
+
+        if self._shape_segment_cache is None:
+            shape_ids = list(self.get_non_tool_shape_ids())
+            outlines = []
+            for shape_id in shape_ids:
+                coords_array = self.get_shape_canvas_xy(shape_id)
+                outlines.append(
+                    _get_shape_outline_coords(self.get_vector_object(shape_id).type, coords_array))
+            self._shape_segment_cache = _ShapeSegmentCache(shape_ids, outlines)
+        return self._shape_segment_cache
 
     def get_canvas_line_length(self, line_id):
         """
@@ -2150,42 +3087,39 @@ class ImageCanvas(Canvas):
             The integer x canvas coordinate of the nearest vertex.
         """
 
-        the_point = numpy.array([canvas_x, canvas_y])
-        vector_object = self.get_vector_object(shape_id)
         coords = self.get_shape_canvas_coords(shape_id)
-        if vector_object.type in [ShapeTypeConstants.RECT, ShapeTypeConstants.ELLIPSE]:
-            # we may have to reformat the shape for the selection to make sense
-            rect_coords = numpy.array(coords).reshape((2, 2))
-            the_coords = normalized_rectangle_coordinates(coords)
+        if len(coords) <= 2:
+            # a single vertex, so there is no choice to be made
+            x, y = coords[0], coords[1]
+            return 0, float(numpy.hypot(x - canvas_x, y - canvas_y)), int(x), int(y)
 
-            coords_diff = the_coords - the_point
-            dists = numpy.sqrt(numpy.sum(coords_diff*coords_diff, axis=1))
-            the_index = numpy.argmin(dists)
-            closest = the_coords[the_index, :]
-
-            if not (numpy.all(closest == rect_coords[0, :]) or numpy.all(closest == rect_coords[1, :])):
+        vector_object = self.get_vector_object(shape_id)
+        if vector_object.type in [ShapeTypeConstants.RECT, ShapeTypeConstants.ELLIPSE] and \
+                shape_id == self.current_shape_id:
+            # we may have to reformat the shape for the selection to make sense,
+            # but only the shape being edited is ever redefined. There are only
+            # four corners, so plain arithmetic is cheaper than numpy here.
+            x1, y1, x2, y2 = coords[:4]
+            xul, xlr = (x1, x2) if x1 <= x2 else (x2, x1)
+            yul, ylr = (y1, y2) if y1 <= y2 else (y2, y1)
+            corners = ((xul, yul), (xlr, yul), (xlr, ylr), (xul, ylr))
+            dists2 = [(x - canvas_x)*(x - canvas_x) + (y - canvas_y)*(y - canvas_y) for x, y in corners]
+            the_index = dists2.index(min(dists2))
+            closest = corners[the_index]
+
+            if closest != (x1, y1) and closest != (x2, y2):
                 # the rectangle definition involves one of the corners which is not selected, so switch
-                ul = the_coords[0, :].tolist()
-                ur = the_coords[1, :].tolist()
-                lr = the_coords[2, :].tolist()
-                ll = the_coords[3, :].tolist()
-
-                if the_index == 0:  # upper left
-                    self.modify_existing_shape_using_canvas_coords(shape_id, ul+lr)
-                elif the_index == 1:  # upper right
-                    self.modify_existing_shape_using_canvas_coords(shape_id, ur+ll)
-                elif the_index == 2:  # lower right
-                    self.modify_existing_shape_using_canvas_coords(shape_id, ul+lr)
-                else:  # lower left
-                    self.modify_existing_shape_using_canvas_coords(shape_id, ll+ur)
-                coords = self.get_shape_canvas_coords(shape_id)
-
-        the_coords = numpy.array(coords).reshape((-1, 2))
-        coords_diff = the_coords - the_point
-        dists = numpy.sqrt(numpy.sum(coords_diff*coords_diff, axis=1))
-        min_ind = numpy.argmin(dists)
-        the_index = int(min_ind)
-        return the_index, float(dists[min_ind]), int(the_coords[min_ind, 0]), int(the_coords[min_ind, 1])
+                first, second = _RECT_CORNER_REDEFINITION[the_index]
+                coords = list(corners[first] + corners[second])
+                self.modify_existing_shape_using_canvas_coords(shape_id, coords)
+
+        the_coords = numpy.array(coords, dtype='float64').reshape((-1, 2))
+        coords_diff = the_coords - (canvas_x, canvas_y)
+        # the square root is monotonic, so is only required for the minimum
+        dists2 = numpy.einsum('ij,ij->i', coords_diff, coords_diff)
+        the_index = int(numpy.argmin(dists2))
+        return the_index, math.sqrt(dists2[the_index]), \
+            int(the_coords[the_index, 0]), int(the_coords[the_index, 1])
 
     # shape modification and manipulation methods
     def reinitialize_shapes(self):
@@ -2200,10 +3134,10 @@ class ImageCanvas(Canvas):
         if self.variables.canvas_image_object is None:
             return  # nothing to be done
 
-        for tool_id in self.get_tool_shape_ids():
-            self.hide_shape(tool_id)
+        # hide all the tool shapes in a single call
+        self.itemconfigure(_TOOL_SHAPE_TAG, state='hidden')
 
-        for shape_id in copy.deepcopy(self.variables.shape_ids):
+        for shape_id in list(self.variables.shape_ids):
             self.delete_shape(shape_id)  # this handles all tracking issues
         self.redraw_all_shapes()
 
@@ -2216,24 +3150,45 @@ class ImageCanvas(Canvas):
         None
         """
 
-        def do_shape(the_id):
-            vector_object = self.get_vector_object(the_id)
-            if vector_object is None:
-                return
-            pixel_coords = vector_object.image_coords
-            if pixel_coords is None:
-                return
-            new_canvas_coords = self.shape_image_coords_to_canvas_coords(the_id)
-            self.modify_existing_shape_using_canvas_coords(the_id, new_canvas_coords, update_pixel_coords=False)
-
         if self.variables.canvas_image_object is None:
             return  # nothing to be done
 
-        for shape_id in self.variables.shape_ids:
-            do_shape(shape_id)
-
-        for tool_id in self.variables.tool_shape_ids:
-            do_shape(tool_id)
+        self._invalidate_shape_segment_cache()
+        # gather the image coordinates of all shapes, and convert them to
+        #   canvas coordinates in a single vectorized operation
+        vector_objects = self.variables.vector_objects
+        redraw_objects = []
+        all_image_yx = []
+        offsets = [0]
+        for the_ids in [self.variables.shape_ids, self.variables.tool_shape_ids]:
+            for the_id in the_ids:
+                vector_object = vector_objects.get(the_id, None)
+                if vector_object is None or vector_object.image_coords is None:
+                    continue
+                redraw_objects.append(vector_object)
+                all_image_yx.extend(vector_object.image_coords)
+                offsets.append(len(all_image_yx)//2)
+        if len(redraw_objects) == 0:
+            return
+        all_canvas_xy = self.variables.canvas_image_object.full_image_yx_to_canvas_xy(all_image_yx)
+        # truncate to integers once for all shapes, exactly as int() does for each entry
+        all_drawing_xy = all_canvas_xy.astype('int64')
+
+        # issue the Tk coords commands in one burst, bypassing the python wrapper
+        tk_call = self.tk.call
+        for i, vector_object in enumerate(redraw_objects):
+            start, stop = offsets[i], offsets[i+1]
+            if vector_object.type == ShapeTypeConstants.POINT:
+                # the oval bounds are offset before truncation
+                canvas_drawing_coords = _get_canvas_drawing_coords(
+                    vector_object, all_canvas_xy[start:stop].ravel().tolist())
+            else:
+                canvas_drawing_coords = all_drawing_xy[start:stop].ravel().tolist()
+            # noinspection PyBroadException
+            try:
+                tk_call(self._w, 'coords', vector_object.uid, canvas_drawing_coords)
+            except Exception:
+                pass
 
     def hide_shape(self, shape_id):
         """
@@ -2287,7 +3242,7 @@ class ImageCanvas(Canvas):
         None
         """
 
-        if shape_id in self.get_tool_shape_ids():
+        if self.is_tool_shape_id(shape_id):
             return
 
         vector_object = self.get_vector_object(shape_id)
@@ -2297,7 +3252,7 @@ class ImageCanvas(Canvas):
             self.itemconfigure(shape_id, **vector_object.highlight_args)
 
     def lowlight_existing_shape(self, shape_id):
-        if shape_id in self.get_tool_shape_ids():
+        if self.is_tool_shape_id(shape_id):
             return
 
         vector_object = self.get_vector_object(shape_id)
@@ -2348,9 +3303,8 @@ class ImageCanvas(Canvas):
         """
 
         vector_object = self.get_vector_object(shape_id)
-        if not isinstance(image_coords, tuple):
-            image_coords = tuple(image_coords)
         vector_object.image_coords = image_coords
+        self._invalidate_shape_segment_cache()
         if emit:
             self.emit_shape_coords_edit(vector_object.uid, vector_object.type)
 
@@ -2375,23 +3329,16 @@ class ImageCanvas(Canvas):
         None
         """
 
-        def make_int(the_coords):
-            return tuple(int(entry) for entry in the_coords)
-
         vector_object = self.get_vector_object(shape_id)
         if vector_object is None:
             return
-        elif vector_object.type == ShapeTypeConstants.POINT:
-            point_size = vector_object.point_size
-            x1, y1 = (new_coords[0] - point_size), (new_coords[1] - point_size)
-            x2, y2 = (new_coords[0] + point_size), (new_coords[1] + point_size)
-            canvas_drawing_coords = make_int([x1, y1, x2, y2])
-        else:
-            canvas_drawing_coords = make_int(new_coords)
+        canvas_drawing_coords = _get_canvas_drawing_coords(vector_object, new_coords)
 
         # noinspection PyBroadException
         try:
-            self.coords(shape_id, canvas_drawing_coords)
+            # this is on the drag path, so the Tk coords command is issued directly,
+            #   since the coords wrapper parses a return value which is unused here
+            self.tk.call(self._w, 'coords', shape_id, canvas_drawing_coords)
             if update_pixel_coords:
                 self._set_shape_pixel_coords_from_canvas_coords(shape_id, new_coords, emit=emit)
         except Exception:
@@ -2433,10 +3380,59 @@ class ImageCanvas(Canvas):
 
         vector_object = self.get_vector_object(shape_id)
         vector_object.color = color
-        if vector_object.type in [ShapeTypeConstants.RECT, ShapeTypeConstants.ELLIPSE, ShapeTypeConstants.POLYGON]:
-            self.itemconfigure(shape_id, outline=color)
-        else:
-            self.itemconfigure(shape_id, fill=color)
+        self.tk.call(self._w, 'itemconfigure', shape_id, '-' + _COLOR_OPTION_KEYS[vector_object.type], color)
+
+    def change_shapes_color_by_type(self, shape_type, color):
+        """
+        Change the color of all shapes of the given type, excluding shapes
+        assigned to tools.
+
+        Parameters
+        ----------
+        shape_type : int|str
+            See ShapeTypeConstants for the enumeration.
+        color : str
+
+        Returns
+        -------
+        None
+        """
+
+        self.change_shapes_color_batch(
+            self.variables.get_shape_ids_by_type(ShapeTypeConstants.validate(shape_type)), color)
+
+    def change_shapes_color_batch(self, shape_ids, color):
+        """
+        Change the color of all the given shapes. The shapes are temporarily
+        tagged according to the color option for their type, and each tag
+        group is configured with a single Tk command.
+
+        Parameters
+        ----------
+        shape_ids : Sequence[int]
+        color : str
+
+        Returns
+        -------
+        None
+        """
+
+        vector_objects = self.variables.vector_objects
+        tk_call = self.tk.call
+        options = set()
+        for shape_id in shape_ids:
+            vector_object = vector_objects.get(shape_id, None)
+            if vector_object is None:
+                continue
+            vector_object.color = color
+            option = _COLOR_OPTION_KEYS[vector_object.type]
+            tk_call(self._w, 'addtag', _RECOLOR_TAG_PREFIX + option, 'withtag', shape_id)
+            options.add(option)
+
+        for option in options:
+            tag = _RECOLOR_TAG_PREFIX + option
+            tk_call(self._w, 'itemconfigure', tag, '-' + option, color)
+            tk_call(self._w, 'dtag', tag)
 
     # shape creation/deletion methods
     def _track_shape(self, vector_object, make_current=True):
@@ -2451,7 +3447,10 @@ class ImageCanvas(Canvas):
         """
 
         self.variables.track_shape(vector_object)
-        if not vector_object.is_tool:
+        self._invalidate_shape_segment_cache()
+        if vector_object.is_tool:
+            self.addtag_withtag(_TOOL_SHAPE_TAG, vector_object.uid)
+        else:
             self.emit_shape_create(vector_object.uid, vector_object.type)
         if make_current:
             self.current_shape_id = vector_object.uid
@@ -2481,6 +3480,7 @@ class ImageCanvas(Canvas):
         self.emit_shape_predelete(shape_id, the_vector.type)
         # remove from tracking
         the_vector = self.variables.remove_shape_from_tracking(shape_id)
+        self._invalidate_shape_segment_cache()
         # delete the shape
         self.delete(shape_id)
         # mit the message that we have deleted the shape
@@ -2513,24 +3513,24 @@ class ImageCanvas(Canvas):
         if vector_object.uid != -1:
             raise ValueError('vector object must not have been previously assigned a id')
 
+        item_type = _CANVAS_ITEM_TYPES.get(vector_object.type, None)
+        if item_type is None:
+            raise ValueError(
+                'Got unhandled vector object type `{}`'.format(ShapeTypeConstants.get_name(vector_object.type)))
+
+        options = vector_object.regular_args
         if vector_object.type == ShapeTypeConstants.POINT:
             point_size = vector_object.point_size
             x1, y1 = (coords[0] - point_size), (coords[1] - point_size)
             x2, y2 = (coords[0] + point_size), (coords[1] + point_size)
-            shape_id = self.create_oval(x1, y1, x2, y2, **vector_object.regular_args)
-        elif vector_object.type in [ShapeTypeConstants.LINE, ShapeTypeConstants.ARROW]:
-            shape_id = self.create_line(*coords, **vector_object.regular_args)
-        elif vector_object.type == ShapeTypeConstants.RECT:
-            shape_id = self.create_rectangle(*coords, **vector_object.regular_args)
-        elif vector_object.type == ShapeTypeConstants.ELLIPSE:
-            shape_id = self.create_oval(*coords, **vector_object.regular_args)
-        elif vector_object.type == ShapeTypeConstants.POLYGON:
-            shape_id = self.create_polygon(*coords, **vector_object.regular_args)
-        elif vector_object.type == ShapeTypeConstants.TEXT:
-            shape_id = self.create_text(*coords, text=vector_object.text, **vector_object.regular_args)
+            drawing_coords = (x1, y1, x2, y2)
         else:
-            raise ValueError(
-                'Got unhandled vector object type `{}`'.format(ShapeTypeConstants.get_name(vector_object.type)))
+            drawing_coords = coords
+            if vector_object.type == ShapeTypeConstants.TEXT:
+                options = dict(options, text=vector_object.text)
+        # issue the Tk create command directly, rather than through the create_* wrappers
+        shape_id = self.tk.getint(self.tk.call(
+            self._w, 'create', item_type, *drawing_coords, *self._options(options)))
 
         if vector_object.image_drag_limits is None:
             full_ny = self.image_reader.full_image_ny
@@ -2611,15 +3611,16 @@ class ImageCanvas(Canvas):
         int
         """
 
+        state = self.variables.state
         if point_size is None:
-            point_size = self.variables.state.point_size
+            point_size = state.point_size
 
         use_color = self._validate_input_shape_color(color, increment_color)
 
         if regular_options is None:
-            regular_options = copy.deepcopy(self.variables.state.point_options)
+            regular_options = state.point_options.copy()
         if highlight_options is None:
-            highlight_options = copy.deepcopy(self.variables.state.highlight_point_options)
+            highlight_options = state.highlight_point_options.copy()
 
         vector_obj = VectorObject(
             ShapeTypeConstants.POINT, is_tool=is_tool, point_size=point_size, color=use_color,
@@ -2653,12 +3654,13 @@ class ImageCanvas(Canvas):
         int
         """
 
+        state = self.variables.state
         use_color = self._validate_input_shape_color(color, increment_color)
 
         if regular_options is None:
-            regular_options = copy.deepcopy(self.variables.state.line_options)
+            regular_options = state.line_options.copy()
         if highlight_options is None:
-            highlight_options = copy.deepcopy(self.variables.state.highlight_line_options)
+            highlight_options = state.highlight_line_options.copy()
         vector_obj = VectorObject(
             ShapeTypeConstants.LINE, is_tool=is_tool, color=use_color,
             regular_args=regular_options, highlight_args=highlight_options)
@@ -2691,12 +3693,13 @@ class ImageCanvas(Canvas):
         int
         """
 
+        state = self.variables.state
         use_color = self._validate_input_shape_color(color, increment_color)
 
         if regular_options is None:
-            regular_options = copy.deepcopy(self.variables.state.arrow_options)
+            regular_options = state.arrow_options.copy()
         if highlight_options is None:
-            highlight_options = copy.deepcopy(self.variables.state.highlight_arrow_options)
+            highlight_options = state.highlight_arrow_options.copy()
 
         vector_obj = VectorObject(
             ShapeTypeConstants.ARROW, is_tool=is_tool, color=use_color,
@@ -2730,12 +3733,13 @@ class ImageCanvas(Canvas):
         int
         """
 
+        state = self.variables.state
         use_color = self._validate_input_shape_color(color, increment_color)
 
         if regular_options is None:
-            regular_options = copy.deepcopy(self.variables.state.poly_options)
+            regular_options = state.poly_options.copy()
         if highlight_options is None:
-            highlight_options = copy.deepcopy(self.variables.state.highlight_poly_options)
+            highlight_options = state.highlight_poly_options.copy()
 
         vector_obj = VectorObject(
             ShapeTypeConstants.RECT, is_tool=is_tool, color=use_color,
@@ -2769,12 +3773,13 @@ class ImageCanvas(Canvas):
         int
         """
 
+        state = self.variables.state
         use_color = self._validate_input_shape_color(color, increment_color)
 
         if regular_options is None:
-            regular_options = copy.deepcopy(self.variables.state.poly_options)
+            regular_options = state.poly_options.copy()
         if highlight_options is None:
-            highlight_options = copy.deepcopy(self.variables.state.highlight_poly_options)
+            highlight_options = state.highlight_poly_options.copy()
 
         vector_obj = VectorObject(
             ShapeTypeConstants.ELLIPSE, is_tool=is_tool, color=use_color,
@@ -2808,12 +3813,13 @@ class ImageCanvas(Canvas):
         int
         """
 
+        state = self.variables.state
         use_color = self._validate_input_shape_color(color, increment_color)
 
         if regular_options is None:
-            regular_options = copy.deepcopy(self.variables.state.poly_options)
+            regular_options = state.poly_options.copy()
         if highlight_options is None:
-            highlight_options = copy.deepcopy(self.variables.state.highlight_poly_options)
+            highlight_options = state.highlight_poly_options.copy()
 
         vector_obj = VectorObject(
             ShapeTypeConstants.POLYGON, is_tool=is_tool, color=use_color,
@@ -2863,37 +3869,23 @@ class ImageCanvas(Canvas):
         """
 
         vector_object = self.get_vector_object(shape_id)
-        if coordinate_type.lower() == 'canvas':
-            coords = self.get_shape_canvas_coords(shape_id)
+        use_canvas = (coordinate_type.lower() == 'canvas')
+        if vector_object.type in [ShapeTypeConstants.TEXT, ShapeTypeConstants.POINT]:
+            # a single coordinate pair, so no intermediate array is required
+            coords = vector_object.image_coords[:2]
+            if use_canvas:
+                coords = self.image_coords_to_canvas_coords(coords)
+            return Point(coordinates=coords)
+
+        if use_canvas:
+            coords_array = self.get_shape_canvas_xy(shape_id)
         else:
-            coords = self.get_shape_image_coords(shape_id)
-        coords_array = numpy.array(coords, dtype='float64').reshape((-1, 2))
-
-        if vector_object.type == ShapeTypeConstants.TEXT:
-            return Point(coordinates=coords_array[0, :])
-        elif vector_object.type == ShapeTypeConstants.POINT:
-            return Point(coordinates=coords_array[0, :])
-        elif vector_object.type == ShapeTypeConstants.RECT:
-            rect_coords = numpy.zeros((4, 2), dtype='float64')
-            rect_coords[0, :] = coords_array[0, :]
-            rect_coords[1, :] = [coords_array[0, 0], coords_array[1, 1]]
-            rect_coords[2, :] = coords_array[1, :]
-            rect_coords[3, :] = [coords_array[1, 0], coords_array[0, 1]]
-            return LinearRing(coordinates=rect_coords)
-        elif vector_object.type == ShapeTypeConstants.ELLIPSE:
-            mid_point = 0.5*(coords_array[0, :] + coords_array[1, :])
-            r_0 = 0.5*numpy.abs(coords_array[1, 0] - coords_array[0, 0])
-            r_1 = 0.5*numpy.abs(coords_array[1, 1] - coords_array[0, 1])
-            pts = 60
-            theta = numpy.linspace(0, 2*numpy.pi, pts)
-            ellipse_coords = numpy.zeros((pts, 2), dtype='float64')
-            ellipse_coords[:, 0] = mid_point[0] + r_0*numpy.cos(theta)
-            ellipse_coords[:, 1] = mid_point[1] + r_1*numpy.sin(theta)
-            return LinearRing(coordinates=ellipse_coords)
+            coords_array = vector_object.image_yx
+
+        if vector_object.type in [ShapeTypeConstants.RECT, ShapeTypeConstants.ELLIPSE, ShapeTypeConstants.POLYGON]:
+            return LinearRing(coordinates=_get_shape_outline_coords(vector_object.type, coords_array))
         elif vector_object.type in [ShapeTypeConstants.LINE, ShapeTypeConstants.ARROW]:
             return LineString(coordinates=coords_array)
-        elif vector_object.type == ShapeTypeConstants.POLYGON:
-            return LinearRing(coordinates=coords_array)
         else:
             raise ValueError(
                 'Unhandled geometry type {} for conversion from tkinter to sarpy geometry type'.format(
@@ -2931,7 +3923,24 @@ class ImageCanvas(Canvas):
         Tuple
         """
 
-        return self.image_coords_to_canvas_coords(self.get_vector_object(shape_id).image_coords)
+        return self.shape_image_coords_to_canvas_coords(shape_id)
+
+    def get_shape_canvas_xy(self, shape_id):
+        """
+        Fetches the canvas coordinates for the shape, as an array in xy order.
+
+        Parameters
+        ----------
+        shape_id : int
+
+        Returns
+        -------
+        numpy.ndarray
+            Of shape `(N, 2)`.
+        """
+
+        return self.variables.canvas_image_object.full_image_yx_to_canvas_xy(
+            self.get_vector_object(shape_id).image_yx)
 
     def get_shape_image_coords(self, shape_id):
         """
@@ -2961,7 +3970,11 @@ class ImageCanvas(Canvas):
         Tuple
         """
 
-        image_coords = self.get_shape_image_coords(shape_id)
+        vector_object = self.get_vector_object(shape_id)
+        image_coords = vector_object.image_coords
+        if image_coords is not None and len(image_coords) >= 2*_VECTORIZED_COORDS_MINIMUM:
+            # use the stored array, rather than constructing a new one
+            image_coords = vector_object.image_yx
         return self.variables.canvas_image_object.full_image_yx_to_canvas_coords(image_coords)
 
     def image_coords_to_canvas_coords(self, image_coords):
@@ -3182,7 +4195,7 @@ class ImageCanvas(Canvas):
         shape_type : int
         """
 
-        if shape_id is None or shape_id in self.get_tool_shape_ids():
+        if shape_id is None or self.is_tool_shape_id(shape_id):
             return
         self.event_generate('<<ShapeSelect>>', x=shape_id, y=shape_type)
 
@@ -3197,7 +4210,7 @@ class ImageCanvas(Canvas):
         shape_type : int
         """
 
-        if shape_id is None or shape_id in self.get_tool_shape_ids():
+        if shape_id is None or self.is_tool_shape_id(shape_id):
             return
         self.event_generate('<<ShapeDeselect>>', x=shape_id, y=shape_type)
 
@@ -3214,7 +4227,7 @@ class ImageCanvas(Canvas):
 
         if shape_id is None:
             return
-        elif shape_id not in self.get_tool_shape_ids():
+        elif not self.is_tool_shape_id(shape_id):
             self.event_generate('<<ShapeCoordsEdit>>', x=shape_id, y=shape_type)
 
     def emit_select_changed(self):
@@ -3243,7 +4256,7 @@ class ImageCanvas(Canvas):
             vector_object = self.get_current_vector_object()
         else:
             vector_object = self.get_vector_object(the_id)
-        if vector_object is None or vector_object.uid in self.get_tool_shape_ids():
+        if vector_object is None or self.is_tool_shape_id(vector_object.uid):
             return
         self.event_generate('<<ShapeCoordsFinalized>>', x=vector_object.uid, y=vector_object.type)
 
@@ -23,6 +23,8 @@ _TOOL_DICT = OrderedDict()
 _CURRENT_ENUM_VALUE = -1
 _TOOL_NAME_TO_ENUM = OrderedDict()
 _TOOL_ENUM_TO_NAME = OrderedDict()
+# the cursors for the normalized rectangle corners, in order
+_RECT_CORNER_CURSORS = ("top_left_corner", "top_right_corner", "bottom_right_corner", "bottom_left_corner")
 
 
 ############
@@ -46,6 +48,9 @@ class ShapeTypeConstants(object):
         ('POLYGON', POLYGON),
         ('TEXT', TEXT)])
     _values_to_names = {value: key for key, value in _names_to_values.items()}
+    # both the names and the values map to the value, for single lookup validation
+    _valid_values = dict(_names_to_values)
+    _valid_values.update(zip(_values_to_names, _values_to_names))
 
     @classmethod
     def validate(cls, value):
@@ -62,11 +67,7 @@ class ShapeTypeConstants(object):
         None|int
         """
 
-        if value in cls._names_to_values:
-            return cls._names_to_values[value]
-        if value in cls._values_to_names:
-            return value
-        return None
+        return cls._valid_values.get(value, None)
 
     @classmethod
     def get_name(cls, value):
@@ -101,6 +102,13 @@ class ShapeTypeConstants(object):
         return [cls.POINT, cls.TEXT]
 
 
+# shape type groupings, for membership tests in the event handlers
+_POINT_TYPES = frozenset([ShapeTypeConstants.POINT, ShapeTypeConstants.TEXT])
+_VERTEX_TYPES = frozenset([ShapeTypeConstants.LINE, ShapeTypeConstants.POLYGON])
+_SEGMENT_TYPES = frozenset([ShapeTypeConstants.LINE, ShapeTypeConstants.ARROW])
+_BOX_TYPES = frozenset([ShapeTypeConstants.RECT, ShapeTypeConstants.ELLIPSE])
+
+
 def normalized_rectangle_coordinates(coords):
     """
     Common pattern for comparing an rectangle/ellipse bounds and event coordinates.
@@ -121,12 +129,15 @@ def normalized_rectangle_coordinates(coords):
 
     select_x1, select_y1, select_x2, select_y2 = coords
 
-    xul = min(select_x1, select_x2)
-    xlr = max(select_x1, select_x2)
-    yul = min(select_y1, select_y2)
-    ylr = max(select_y1, select_y2)
+    xul, xlr = (select_x1, select_x2) if select_x1 <= select_x2 else (select_x2, select_x1)
+    yul, ylr = (select_y1, select_y2) if select_y1 <= select_y2 else (select_y2, select_y1)
 
-    the_coords = numpy.array([[xul, yul], [xlr, yul], [xlr, ylr], [xul, ylr]])
+    # filled directly, which is much cheaper than parsing nested lists
+    the_coords = numpy.empty((4, 2), dtype='float64')
+    the_coords[0, 0] = the_coords[3, 0] = xul
+    the_coords[1, 0] = the_coords[2, 0] = xlr
+    the_coords[0, 1] = the_coords[1, 1] = yul
+    the_coords[2, 1] = the_coords[3, 1] = ylr
     return the_coords
 
 
@@ -148,7 +159,8 @@ def _get_canvas_event_coords(image_canvas, event):
     return image_canvas.canvasx(event.x), image_canvas.canvasy(event.y)
 
 
-def _modify_coords(image_canvas, shape_id, coords, event_x_pos, event_y_pos, at_index, insert=False):
+def _modify_coords(
+        image_canvas, shape_id, coords, event_x_pos, event_y_pos, at_index, insert=False, canvas_limits=None):
     """
     Modify the coordinates for lines/polygons.
 
@@ -163,6 +175,9 @@ def _modify_coords(image_canvas, shape_id, coords, event_x_pos, event_y_pos, at_
         The index at which to insert or replace
     insert : bool
         Insert a new point, or replace?
+    canvas_limits : None|Tuple
+        The drag limits in canvas coordinates. If not provided, these are
+        determined from the vector object.
 
     Returns
     -------
@@ -170,55 +185,21 @@ def _modify_coords(image_canvas, shape_id, coords, event_x_pos, event_y_pos, at_
         The new coordinates and update index.
     """
 
-    def trim_to_drag_limits(event_x, event_y):
-        """
-        Trim coordinates to the given drag limits.
-
-        Parameters
-        ----------
-        event_x : int|float
-        event_y : int|float
-
-        Returns
-        -------
-        float, float
-        """
-
-        def trim(value, l_bound, u_bound):
-            if value < l_bound:
-                return l_bound
-            elif value > u_bound:
-                return u_bound
-            else:
-                return value
-
-        if drag_lims:
-            canvas_lims = image_canvas.image_coords_to_canvas_coords(drag_lims)
-            event_x = trim(event_x, canvas_lims[0], canvas_lims[2])
-            event_y = trim(event_y, canvas_lims[1], canvas_lims[3])
-        return event_x, event_y
-
-    drag_lims = image_canvas.get_vector_object(shape_id).image_drag_limits
-    event_x_pos, event_y_pos = trim_to_drag_limits(event_x_pos, event_y_pos)
+    if canvas_limits is None:
+        canvas_limits = _get_shape_canvas_limits(image_canvas, shape_id)
+    if canvas_limits is not None:
+        event_x_pos = max(canvas_limits[0], min(canvas_limits[2], event_x_pos))
+        event_y_pos = max(canvas_limits[1], min(canvas_limits[3], event_y_pos))
+    # a single copy, modified in place by slice assignment
+    out = list(coords)
+    index_insert = 2*at_index
     if insert:
-        if 2*at_index == len(coords) - 2:
-            # it's the final coordinate
-            out = list(coords) + [event_x_pos, event_y_pos]
-        else:
-            index_insert = 2*at_index
-            out = list(coords[:index_insert + 2]) + [event_x_pos, event_y_pos] + list(coords[index_insert + 2:])
-        # increment insert_at_index
+        # insert after the given coordinate, and increment insert_at_index
+        out[index_insert + 2:index_insert + 2] = (event_x_pos, event_y_pos)
         at_index += 1
-        return out, at_index
     else:
-        if at_index == 0:
-            out = [event_x_pos, event_y_pos] + list(coords[2:])
-        elif 2*at_index == len(coords) - 2:
-            out = list(coords[:-2]) + [event_x_pos, event_y_pos]
-        else:
-            index_insert = 2*at_index
-            out = list(coords[:index_insert]) + [event_x_pos, event_y_pos] + list(coords[index_insert + 2:])
-        return out, at_index
+        out[index_insert:index_insert + 2] = (event_x_pos, event_y_pos)
+    return out, at_index
 
 
 def _shift_shape_coords(canvas_event, anchor, coords, canvas_limits):
@@ -243,28 +224,42 @@ def _shift_shape_coords(canvas_event, anchor, coords, canvas_limits):
 
     x_dist = canvas_event[0] - anchor[0]
     y_dist = canvas_event[1] - anchor[1]
-    new_coords = numpy.asarray(coords) + x_dist
-    new_coords_y = numpy.asarray(coords) + y_dist
-    new_coords[1::2] = new_coords_y[1::2]
+    new_coords = numpy.array(coords, dtype='float64')
+    x_vertices = new_coords[0::2]
+    y_vertices = new_coords[1::2]
+    x_vertices += x_dist
+    y_vertices += y_dist
     if canvas_limits is not None:
-        x_vertices = new_coords[0::2]
-        y_vertices = new_coords[1::2]
-        within_x_limits = True
-        within_y_limits = True
-        for x_vertex in x_vertices:
-            if canvas_limits[2] < x_vertex or x_vertex < canvas_limits[0]:
-                within_x_limits = False
-        for y_vertex in y_vertices:
-            if y_vertex < canvas_limits[1] or y_vertex > canvas_limits[3]:
-                within_y_limits = False
-        if not within_x_limits:
-            new_coords[0::2] = coords[0::2]
-        if not within_y_limits:
-            new_coords[1::2] = coords[1::2]
+        # any direction which leaves the limits is not shifted
+        if x_vertices.min() < canvas_limits[0] or x_vertices.max() > canvas_limits[2]:
+            x_vertices[:] = coords[0::2]
+        if y_vertices.min() < canvas_limits[1] or y_vertices.max() > canvas_limits[3]:
+            y_vertices[:] = coords[1::2]
     return new_coords
 
 
-def _perform_shape_shift(image_canvas, shape_id, canvas_event, anchor, emit=True):
+def _get_shape_canvas_limits(image_canvas, shape_id):
+    """
+    Gets the shape drag limits in canvas coordinates.
+
+    Parameters
+    ----------
+    image_canvas : tk_builder.widgets.image_canvas.ImageCanvas
+    shape_id : int
+        The shape id, with respect to the image canvas.
+
+    Returns
+    -------
+    None|Tuple
+    """
+
+    drag_limits = image_canvas.get_vector_object(shape_id).image_drag_limits
+    if drag_limits is None:
+        return None
+    return image_canvas.image_coords_to_canvas_coords(drag_limits)
+
+
+def _perform_shape_shift(image_canvas, shape_id, canvas_event, anchor, emit=True, canvas_limits=None):
     """
     Helper function to actually perform the shape shift operation.
 
@@ -279,14 +274,13 @@ def _perform_shape_shift(image_canvas, shape_id, canvas_event, anchor, emit=True
         The anchor coordinates wrt the image canvas.
     emit : bool
         Emit the signal, via the image canvas, that the shape has been updated?
+    canvas_limits : None|Tuple
+        The drag limits in canvas coordinates. If not provided, these are
+        determined from the vector object.
     """
 
-    vector_object = image_canvas.get_vector_object(shape_id)
-    if vector_object.image_drag_limits is not None:
-        canvas_limits = image_canvas.image_coords_to_canvas_coords(
-            vector_object.image_drag_limits)
-    else:
-        canvas_limits = None
+    if canvas_limits is None:
+        canvas_limits = _get_shape_canvas_limits(image_canvas, shape_id)
     new_coords = _shift_shape_coords(
         canvas_event, anchor,
         image_canvas.get_shape_canvas_coords(shape_id), canvas_limits)
@@ -341,6 +335,7 @@ class ImageCanvasTool(object):
         """
 
         self.image_canvas = image_canvas
+        self._drag_canvas_limits = {}  # shape id -> canvas drag limits, for the current drag
 
     @property
     def name(self):
@@ -371,6 +366,28 @@ class ImageCanvasTool(object):
             raise ValueError('Got disallowed value `{}`'.format(value))
         self._mode = value
 
+    def _get_drag_canvas_limits(self, shape_id):
+        """
+        Gets the shape drag limits in canvas coordinates. The view does not
+        change during a drag, so these are only converted once per drag, and
+        reset on the mouse click starting the drag.
+
+        Parameters
+        ----------
+        shape_id : int
+
+        Returns
+        -------
+        None|Tuple
+        """
+
+        try:
+            return self._drag_canvas_limits[shape_id]
+        except KeyError:
+            canvas_limits = _get_shape_canvas_limits(self.image_canvas, shape_id)
+            self._drag_canvas_limits[shape_id] = canvas_limits
+            return canvas_limits
+
     def initialize_tool(self, **kwargs):
         """
         This should be executed as an step step for this tool (as the tool gets set).
@@ -652,6 +669,35 @@ class ZoomOutTool(_ZoomTool):
         self.mouse_moved = False
 
 
+def _get_pan_shift_limit(the_shift, the_limit, lower_value, upper_value):
+    """
+    Limits the pan shift along one axis, so that the image bounds remain inside
+    the full image.
+
+    Parameters
+    ----------
+    the_shift : int|float
+    the_limit : int
+        The full image size along the axis.
+    lower_value : int|float
+        The current lower image bound.
+    upper_value : int|float
+        The current upper image bound.
+
+    Returns
+    -------
+    int|float
+    """
+
+    if lower_value < 0 or upper_value > the_limit:
+        raise ValueError('This is not sensible.')
+
+    if the_shift < 0:
+        return max(the_shift, -lower_value)
+    else:
+        return min(the_shift, the_limit - upper_value)
+
+
 class PanTool(ImageCanvasTool):
     """
     Basic pan tool
@@ -675,43 +721,27 @@ class PanTool(ImageCanvasTool):
         self.anchor = _get_canvas_event_coords(self.image_canvas, event)
 
     def pan(self, event, check_distance=True):
-        def get_shift_limit(the_shift, the_limit, lower_value, upper_value):
-            if lower_value < 0 or upper_value > the_limit:
-                raise ValueError('This is not sensible.')
-
-            if the_shift < 0:
-                return max(the_shift, -lower_value)
-            else:
-                return min(the_shift, the_limit - upper_value)
-
-        # get the current image bounds
-        image_bounds, decimation = self.image_canvas.get_image_extent()
-        # get the full image size
-        full_y = self.image_canvas.variables.canvas_image_object.image_reader.full_image_ny
-        full_x = self.image_canvas.variables.canvas_image_object.image_reader.full_image_nx
-
-        # determine how to modify the current image bounds
+        # determine how far we have moved
         canvas_event = _get_canvas_event_coords(self.image_canvas, event)
         canvas_x_diff = self.anchor[0] - canvas_event[0]
         canvas_y_diff = self.anchor[1] - canvas_event[1]
-        canvas_diff = (canvas_x_diff * canvas_x_diff + canvas_y_diff * canvas_y_diff) ** 0.5
-
-        if check_distance and canvas_diff < self.threshold:
+        if check_distance and \
+                canvas_x_diff*canvas_x_diff + canvas_y_diff*canvas_y_diff < self.threshold*self.threshold:
             # we haven't moved far enough
             return
 
-        x_diff = decimation * canvas_x_diff
-        y_diff = decimation * canvas_y_diff
-
-        # verify that the shift limits make sense
-        y_diff = get_shift_limit(y_diff, full_y, image_bounds[0], image_bounds[2])
-        x_diff = get_shift_limit(x_diff, full_x, image_bounds[1], image_bounds[3])
+        # get the current image bounds and the full image size
+        image_bounds, decimation = self.image_canvas.get_image_extent()
+        image_reader = self.image_canvas.variables.canvas_image_object.image_reader
 
-        new_image_bounds = list(image_bounds)
-        new_image_bounds[0] += y_diff
-        new_image_bounds[1] += x_diff
-        new_image_bounds[2] += y_diff
-        new_image_bounds[3] += x_diff
+        # determine how to modify the current image bounds
+        y_diff = _get_pan_shift_limit(
+            decimation*canvas_y_diff, image_reader.full_image_ny, image_bounds[0], image_bounds[2])
+        x_diff = _get_pan_shift_limit(
+            decimation*canvas_x_diff, image_reader.full_image_nx, image_bounds[1], image_bounds[3])
+        new_image_bounds = [
+            image_bounds[0] + y_diff, image_bounds[1] + x_diff,
+            image_bounds[2] + y_diff, image_bounds[3] + x_diff]
 
         # apply view to the new rectangle
         self.image_canvas.zoom_to_full_image_selection(
@@ -720,11 +750,19 @@ class PanTool(ImageCanvasTool):
         # update the anchor point to the current point
         self.anchor = canvas_event
 
+    def _set_resample(self, resample):
+        canvas_image_object = self.image_canvas.variables.canvas_image_object
+        if canvas_image_object is not None:
+            canvas_image_object.resample = resample
+
     def on_left_mouse_motion(self, event):
+        # use the cheaper resampling while dragging
+        self._set_resample(self.image_canvas.variables.config.interactive_resample_method)
         self.pan(event, check_distance=True)
         self.image_canvas.config(cursor='fleur')
 
     def on_left_mouse_release(self, event):
+        self._set_resample(self.image_canvas.variables.config.resample_method)
         self.pan(event, check_distance=False)
         self.image_canvas.config(cursor='arrow')
 
@@ -734,7 +772,8 @@ class SelectTool(ImageCanvasTool):
     _mode_values = {"normal", "edit", "shift"}
 
     def __init__(self, image_canvas):
-        self._cursors = ["top_left_corner", "top_right_corner", "bottom_right_corner", "bottom_left_corner"]
+        self._cursors = _RECT_CORNER_CURSORS
+        self._point = numpy.zeros((2, ), dtype='float64')  # reused for each hover event
         ImageCanvasTool.__init__(self, image_canvas)
         self.size_threshold = self.image_canvas.variables.config.select_size_threshold
         self.vertex_threshold = self.image_canvas.variables.config.vertex_selector_pixel_threshold
@@ -771,7 +810,8 @@ class SelectTool(ImageCanvasTool):
 
     def _perform_shift(self, canvas_event, emit=True):
         _perform_shape_shift(
-            self.image_canvas, self.shape_id, canvas_event, self.anchor, emit=False)
+            self.image_canvas, self.shape_id, canvas_event, self.anchor, emit=False,
+            canvas_limits=self._get_drag_canvas_limits(self.shape_id))
         self.anchor = canvas_event
         if emit:
             self.image_canvas.emit_select_changed()
@@ -784,6 +824,7 @@ class SelectTool(ImageCanvasTool):
 
     def on_left_mouse_click(self, event):
         self.mouse_moved = False
+        self._drag_canvas_limits.clear()
         canvas_event = _get_canvas_event_coords(self.image_canvas, event)
         if self.mode == "normal":
             self.anchor = canvas_event
@@ -821,15 +862,16 @@ class SelectTool(ImageCanvasTool):
         previous_mode = self.mode
 
         canvas_event = _get_canvas_event_coords(self.image_canvas, event)
-        the_point = numpy.array(canvas_event)
+        the_point = self._point
+        the_point[0] = canvas_event[0]
+        the_point[1] = canvas_event[1]
         coords = self.image_canvas.get_shape_canvas_coords(self.shape_id)
         the_coords = normalized_rectangle_coordinates(coords)
         coords_diff = the_coords - the_point
-        dists = numpy.sqrt(numpy.sum(coords_diff * coords_diff, axis=1))
-
-        arg_min = numpy.argmin(dists)
+        dists2 = numpy.einsum('ij,ij->i', coords_diff, coords_diff)
 
-        if dists[arg_min] < self.vertex_threshold:
+        arg_min = int(dists2.argmin())
+        if dists2[arg_min] < self.vertex_threshold*self.vertex_threshold:
             opposite_corner = ((arg_min + 2) % 4)
             new_mode = "edit"
             self.anchor = int(the_coords[opposite_corner, 0]), int(the_coords[opposite_corner, 1])
@@ -938,6 +980,7 @@ class ShiftShapeTool(ImageCanvasTool):
 
     def on_left_mouse_click(self, event):
         self.mouse_moved = False
+        self._drag_canvas_limits.clear()
         if len(self.shape_ids) == 0:
             self.image_canvas.select_closest_shape(event, set_as_current=True)
             self.initialize_tool()
@@ -950,7 +993,9 @@ class ShiftShapeTool(ImageCanvasTool):
         self.mouse_moved = True
         canvas_event = _get_canvas_event_coords(self.image_canvas, event)
         for entry in self.shape_ids:
-            _perform_shape_shift(self.image_canvas, entry, canvas_event, self.anchor, emit=True)
+            _perform_shape_shift(
+                self.image_canvas, entry, canvas_event, self.anchor, emit=True,
+                canvas_limits=self._get_drag_canvas_limits(entry))
         self.anchor = canvas_event
 
     def on_left_mouse_release(self, event):
@@ -959,7 +1004,9 @@ class ShiftShapeTool(ImageCanvasTool):
 
         canvas_event = _get_canvas_event_coords(self.image_canvas, event)
         for entry in self.shape_ids:
-            _perform_shape_shift(self.image_canvas, entry, canvas_event, self.anchor, emit=False)
+            _perform_shape_shift(
+                self.image_canvas, entry, canvas_event, self.anchor, emit=False,
+                canvas_limits=self._get_drag_canvas_limits(entry))
             self.image_canvas.emit_shape_coords_finalized(the_id=entry)
 
         self.mode = "normal"
@@ -973,35 +1020,34 @@ class ShiftShapeTool(ImageCanvasTool):
 
 class NewShapeTool(ViewTool):
     _name = 'NEW_SHAPE'
+    # shape type -> (creation method name, insert index, coordinate form, keyword arguments)
+    _new_shape_dispatch = {
+        ShapeTypeConstants.POINT: ('create_new_point', 0, 'point', {}),
+        ShapeTypeConstants.TEXT: ('create_new_text', 0, 'point', {'text': 'Text'}),
+        ShapeTypeConstants.LINE: ('create_new_line', 1, 'staggered', {}),
+        ShapeTypeConstants.ARROW: ('create_new_arrow', 1, 'staggered', {}),
+        ShapeTypeConstants.RECT: ('create_new_rect', 1, 'staggered', {}),
+        ShapeTypeConstants.ELLIPSE: ('create_new_ellipse', 1, 'staggered', {}),
+        ShapeTypeConstants.POLYGON: ('create_new_polygon', 1, 'doubled', {})}
 
     def on_left_mouse_click(self, event):
-        def staggered_coord():
-            return canvas_event[0], canvas_event[1], canvas_event[0]+1, canvas_event[1]+1
-
         new_shape_type = self.image_canvas.new_shape_type
         canvas_event = _get_canvas_event_coords(self.image_canvas, event)
-        insert_at_index = 1
-        if new_shape_type == ShapeTypeConstants.POINT:
-            self.image_canvas.create_new_point(canvas_event)
-            insert_at_index = 0
-        elif new_shape_type == ShapeTypeConstants.TEXT:
-            self.image_canvas.create_new_text(canvas_event, text='Text')
-            insert_at_index = 0
-        elif new_shape_type == ShapeTypeConstants.LINE:
-            self.image_canvas.create_new_line(staggered_coord())
-        elif new_shape_type == ShapeTypeConstants.ARROW:
-            self.image_canvas.create_new_arrow(staggered_coord())
-        elif new_shape_type == ShapeTypeConstants.RECT:
-            self.image_canvas.create_new_rect(staggered_coord())
-        elif new_shape_type == ShapeTypeConstants.ELLIPSE:
-            self.image_canvas.create_new_ellipse(staggered_coord())
-        elif new_shape_type == ShapeTypeConstants.POLYGON:
-            self.image_canvas.create_new_polygon(canvas_event + canvas_event)
-        else:
+        dispatch = self._new_shape_dispatch.get(new_shape_type, None)
+        if dispatch is None:
             raise ValueError(
                 'Got unhandled shape type ShapeTypeConstants.{}'.format(
                     ShapeTypeConstants.get_name(new_shape_type)))
 
+        method_name, insert_at_index, coordinate_form, kwargs = dispatch
+        if coordinate_form == 'point':
+            coords = canvas_event
+        elif coordinate_form == 'staggered':
+            coords = (canvas_event[0], canvas_event[1], canvas_event[0]+1, canvas_event[1]+1)
+        else:
+            coords = canvas_event + canvas_event
+        getattr(self.image_canvas, method_name)(coords, **kwargs)
+
         # change the tool to edit the newly created shape
         self.image_canvas.current_tool = 'EDIT_SHAPE'
         self.image_canvas.current_tool.insert_at_index = insert_at_index
@@ -1020,7 +1066,9 @@ class EditShapeTool(ImageCanvasTool):
         self.anchor = (0, 0)
         self.mouse_moved = False
         self.vertex_threshold = self.image_canvas.variables.config.vertex_selector_pixel_threshold
-        self._rect_cursors = ["top_left_corner", "top_right_corner", "bottom_right_corner", "bottom_left_corner"]
+        self._rect_cursors = _RECT_CORNER_CURSORS
+        self._point = numpy.zeros((2, ), dtype='float64')  # reused for each hover event
+        self._live_coords = None  # the canvas coordinates during a vertex drag
 
     def initialize_tool(self, shape_id=None, **kwargs):
         """
@@ -1043,6 +1091,7 @@ class EditShapeTool(ImageCanvasTool):
         self.mouse_moved = False
         self.vertex_threshold = self.image_canvas.variables.config.vertex_selector_pixel_threshold
         self.mode = "normal"
+        self._live_coords = None
 
     def set_current_shape(self, old_shape_id, new_shape_id):
         _default_shape_select(self.image_canvas, old_shape_id, new_shape_id)
@@ -1052,36 +1101,61 @@ class EditShapeTool(ImageCanvasTool):
         self.finalize_tool()
         self.initialize_tool(new_shape_id)
 
-    def _update_text_or_point(self, event):
+    def _update_text_or_point(self, canvas_event):
         self.image_canvas.modify_existing_shape_using_canvas_coords(
-            self.shape_id, _get_canvas_event_coords(self.image_canvas, event), update_pixel_coords=True)
+            self.shape_id, canvas_event, update_pixel_coords=True)
 
-    def _update_line_or_polygon(self, event, insert=True):
-        canvas_event = _get_canvas_event_coords(self.image_canvas, event)
+    def _update_line_or_polygon(self, canvas_event, insert=True):
         old_coords = self.image_canvas.get_shape_canvas_coords(self.shape_id)
         new_coords, self.insert_at_index = _modify_coords(
             self.image_canvas, self.shape_id, old_coords,
             canvas_event[0], canvas_event[1],
-            self.insert_at_index, insert=insert)
+            self.insert_at_index, insert=insert,
+            canvas_limits=self._get_drag_canvas_limits(self.shape_id))
         self.image_canvas.modify_existing_shape_using_canvas_coords(
             self.shape_id, new_coords, update_pixel_coords=True)
 
-    def _update_arrow(self, event):
+    def _update_arrow(self, canvas_event):
         if self.insert_at_index > 1:
             self.insert_at_index = 1
         if self.insert_at_index < 0:
             self.insert_at_index = 0
-        canvas_event = _get_canvas_event_coords(self.image_canvas, event)
         old_coords = self.image_canvas.get_shape_canvas_coords(self.shape_id)
         new_coords, _ = _modify_coords(
             self.image_canvas, self.shape_id, old_coords,
             canvas_event[0], canvas_event[1],
-            self.insert_at_index, insert=False)
+            self.insert_at_index, insert=False,
+            canvas_limits=self._get_drag_canvas_limits(self.shape_id))
         self.image_canvas.modify_existing_shape_using_canvas_coords(
             self.shape_id, new_coords, update_pixel_coords=True)
 
+    def _drag_vertex(self, canvas_event, emit=True):
+        """
+        Moves the vertex at the insertion index to the given location. The
+        canvas coordinates are tracked for the duration of the drag, rather
+        than converted from the image coordinates for every event.
+
+        Parameters
+        ----------
+        canvas_event : Tuple
+        emit : bool
+        """
+
+        previous_coords = self._live_coords
+        if previous_coords is None:
+            previous_coords = self.image_canvas.get_shape_canvas_coords(self.shape_id)
+        new_coords, _ = _modify_coords(
+            self.image_canvas, self.shape_id, previous_coords,
+            canvas_event[0], canvas_event[1],
+            self.insert_at_index, insert=False,
+            canvas_limits=self._get_drag_canvas_limits(self.shape_id))
+        self.image_canvas.modify_existing_shape_using_canvas_coords(self.shape_id, new_coords, emit=emit)
+        self._live_coords = new_coords
+
     def on_left_mouse_click(self, event):
         self.mouse_moved = False
+        self._drag_canvas_limits.clear()
+        self._live_coords = None
         canvas_event = _get_canvas_event_coords(self.image_canvas, event)
         if self.shape_id is None:
             closest_shape_id = self.image_canvas.select_closest_shape(event, set_as_current=True)
@@ -1101,8 +1175,8 @@ class EditShapeTool(ImageCanvasTool):
             self.anchor = canvas_event
             return
 
-        if self.vector_object.type in [ShapeTypeConstants.POINT, ShapeTypeConstants.TEXT]:
-            self._update_text_or_point(event)
+        if self.vector_object.type in _POINT_TYPES:
+            self._update_text_or_point(canvas_event)
             return
 
         coord_index, the_distance, coord_x, coord_y = self.image_canvas.find_closest_shape_coord(
@@ -1111,11 +1185,11 @@ class EditShapeTool(ImageCanvasTool):
             self.insert_at_index = coord_index
             return
 
-        if self.vector_object.type in [ShapeTypeConstants.LINE, ShapeTypeConstants.POLYGON]:
-            self._update_line_or_polygon(event, insert=True)
+        if self.vector_object.type in _VERTEX_TYPES:
+            self._update_line_or_polygon(canvas_event, insert=True)
         elif self.vector_object.type == ShapeTypeConstants.ARROW:
-            self._update_arrow(event)
-        elif self.vector_object.type in [ShapeTypeConstants.RECT, ShapeTypeConstants.ELLIPSE]:
+            self._update_arrow(canvas_event)
+        elif self.vector_object.type in _BOX_TYPES:
             self.image_canvas.modify_existing_shape_using_canvas_coords(
                 self.shape_id, canvas_event + canvas_event)
             self.anchor = canvas_event
@@ -1125,33 +1199,28 @@ class EditShapeTool(ImageCanvasTool):
         self.mouse_moved = True
         canvas_event = _get_canvas_event_coords(self.image_canvas, event)
         if self.mode == "normal":
-            previous_coords = self.image_canvas.get_shape_canvas_coords(self.shape_id)
-            new_coords, _ = _modify_coords(
-                self.image_canvas, self.shape_id, previous_coords,
-                canvas_event[0], canvas_event[1],
-                self.insert_at_index, insert=False)
-            self.image_canvas.modify_existing_shape_using_canvas_coords(self.shape_id, new_coords)
+            self._drag_vertex(canvas_event, emit=True)
         elif self.mode == "shift":
-            _perform_shape_shift(self.image_canvas, self.shape_id, canvas_event, self.anchor, emit=True)
+            _perform_shape_shift(
+                self.image_canvas, self.shape_id, canvas_event, self.anchor, emit=True,
+                canvas_limits=self._get_drag_canvas_limits(self.shape_id))
             self.anchor = canvas_event
 
     def on_left_mouse_release(self, event):
         canvas_event = _get_canvas_event_coords(self.image_canvas, event)
         if self.mode == "normal":
             if self.mouse_moved:
-                previous_coords = self.image_canvas.get_shape_canvas_coords(self.shape_id)
-                new_coords, _ = _modify_coords(
-                    self.image_canvas, self.shape_id, previous_coords,
-                    canvas_event[0], canvas_event[1],
-                    self.insert_at_index, insert=False)
-                self.image_canvas.modify_existing_shape_using_canvas_coords(self.shape_id, new_coords, emit=False)
+                self._drag_vertex(canvas_event, emit=False)
                 self.image_canvas.emit_shape_coords_finalized(the_id=self.shape_id)
         elif self.mode == "shift":
             if self.mouse_moved:
-                _perform_shape_shift(self.image_canvas, self.shape_id, canvas_event, self.anchor, emit=False)
+                _perform_shape_shift(
+                    self.image_canvas, self.shape_id, canvas_event, self.anchor, emit=False,
+                    canvas_limits=self._get_drag_canvas_limits(self.shape_id))
                 self.image_canvas.emit_shape_coords_finalized(the_id=self.shape_id)
                 self.mode = "normal"
         self.mouse_moved = False
+        self._live_coords = None
 
     def on_mouse_motion(self, event):
         if self.shape_id is None:
@@ -1159,17 +1228,23 @@ class EditShapeTool(ImageCanvasTool):
         if self.vector_object is None:
             raise ValueError('Bad state')
 
-        canvas_event = _get_canvas_event_coords(self.image_canvas, event)
-        if self.vector_object.type in [ShapeTypeConstants.RECT, ShapeTypeConstants.ELLIPSE]:
-            the_point = numpy.array(canvas_event, dtype='float64')
-            coords = self.image_canvas.get_shape_canvas_coords(self.shape_id)
+        image_canvas = self.image_canvas
+        shape_id = self.shape_id
+        shape_type = self.vector_object.type
+        vertex_threshold = self.vertex_threshold
+        canvas_event = _get_canvas_event_coords(image_canvas, event)
+        if shape_type in _BOX_TYPES:
+            the_point = self._point
+            the_point[0] = canvas_event[0]
+            the_point[1] = canvas_event[1]
+            coords = image_canvas.get_shape_canvas_coords(shape_id)
             the_coords = normalized_rectangle_coordinates(coords)
             coords_diff = the_coords - the_point
-            dists = numpy.sum(coords_diff * coords_diff, axis=1)
+            dists2 = numpy.einsum('ij,ij->i', coords_diff, coords_diff)
 
-            arg_min = numpy.argmin(dists)
+            arg_min = int(dists2.argmin())
             previous_mode = self.mode
-            if dists[arg_min] < self.vertex_threshold:
+            if dists2[arg_min] < vertex_threshold*vertex_threshold:
                 new_mode = "normal"
                 self.anchor = int(the_coords[arg_min, 0]), int(the_coords[arg_min, 1])
                 cursor = self._rect_cursors[arg_min]
@@ -1183,31 +1258,31 @@ class EditShapeTool(ImageCanvasTool):
 
             if previous_mode != new_mode:
                 self.mode = new_mode
-                self.image_canvas.config(cursor=cursor)
+                image_canvas.config(cursor=cursor)
 
-        elif self.vector_object.type in [ShapeTypeConstants.LINE, ShapeTypeConstants.ARROW]:
-            the_dist = self.image_canvas.find_distance_from_shape(
-                self.vector_object.uid, canvas_event[0], canvas_event[1])
-            the_vertex, vertex_distance, _, _ = self.image_canvas.find_closest_shape_coord(
-                self.vector_object.uid, canvas_event[0], canvas_event[1])
+        elif shape_type in _SEGMENT_TYPES:
+            the_dist = image_canvas.find_distance_from_shape(
+                shape_id, canvas_event[0], canvas_event[1])
+            the_vertex, vertex_distance, _, _ = image_canvas.find_closest_shape_coord(
+                shape_id, canvas_event[0], canvas_event[1])
 
-            if vertex_distance < self.vertex_threshold:
-                self.image_canvas.config(cursor='cross')
+            if vertex_distance < vertex_threshold:
+                image_canvas.config(cursor='cross')
                 self.mode = "normal"
-            elif the_dist < self.vertex_threshold:
-                self.image_canvas.config(cursor='fleur')
+            elif the_dist < vertex_threshold:
+                image_canvas.config(cursor='fleur')
                 self.mode = "shift"
             else:
                 self.mode = "normal"
-                self.image_canvas.config(cursor='arrow')
-        elif self.vector_object.type == ShapeTypeConstants.POLYGON:
-            the_vertex, vertex_distance, _, _ = self.image_canvas.find_closest_shape_coord(
-                self.shape_id, canvas_event[0], canvas_event[1])
+                image_canvas.config(cursor='arrow')
+        elif shape_type == ShapeTypeConstants.POLYGON:
+            the_vertex, vertex_distance, _, _ = image_canvas.find_closest_shape_coord(
+                shape_id, canvas_event[0], canvas_event[1])
 
             # noinspection PyBroadException
             try:
-                geometry_object = self.image_canvas.get_geometry_for_shape(
-                    self.shape_id, coordinate_type='canvas')
+                geometry_object = image_canvas.get_geometry_for_shape(
+                    shape_id, coordinate_type='canvas')
             except Exception:
                 geometry_object = None
 
@@ -1225,23 +1300,23 @@ class EditShapeTool(ImageCanvasTool):
                     contained = False
                 the_dist = geometry_object.get_minimum_distance(canvas_event)
 
-            if vertex_distance < self.vertex_threshold:
-                self.image_canvas.config(cursor='cross')
+            if vertex_distance < vertex_threshold:
+                image_canvas.config(cursor='cross')
                 self.mode = "normal"
-            elif contained or the_dist < self.vertex_threshold:
-                self.image_canvas.config(cursor='fleur')
+            elif contained or the_dist < vertex_threshold:
+                image_canvas.config(cursor='fleur')
                 self.mode = "shift"
             else:
-                self.image_canvas.config(cursor='arrow')
+                image_canvas.config(cursor='arrow')
                 self.mode = "normal"
-        elif self.vector_object.type in [ShapeTypeConstants.POINT, ShapeTypeConstants.TEXT]:
-            the_dist = self.image_canvas.find_distance_from_shape(
-                self.shape_id, canvas_event[0], canvas_event[1])
-            if the_dist < self.vertex_threshold:
-                self.image_canvas.config(cursor='fleur')
+        elif shape_type in _POINT_TYPES:
+            the_dist = image_canvas.find_distance_from_shape(
+                shape_id, canvas_event[0], canvas_event[1])
+            if the_dist < vertex_threshold:
+                image_canvas.config(cursor='fleur')
                 self.mode = "shift"
             else:
-                self.image_canvas.config(cursor='arrow')
+                image_canvas.config(cursor='arrow')
                 self.mode = "normal"
 
     def on_right_mouse_click(self, event):
@@ -1249,7 +1324,7 @@ class EditShapeTool(ImageCanvasTool):
             return
 
         if self.mode == "normal":
-            if self.vector_object.type not in [ShapeTypeConstants.LINE, ShapeTypeConstants.POLYGON]:
+            if self.vector_object.type not in _VERTEX_TYPES:
                 return
 
             # delete the coordinate at the current insertion index
@@ -1398,6 +1473,7 @@ class MeasureTool(ImageCanvasTool):
 
     def on_left_mouse_click(self, event):
         self.mouse_moved = False
+        self._drag_canvas_limits.clear()
         canvas_event = _get_canvas_event_coords(self.image_canvas, event)
         if self.mode == "shift":
             self.anchor = canvas_event
@@ -1418,10 +1494,13 @@ class MeasureTool(ImageCanvasTool):
             new_coords, _ = _modify_coords(
                 self.image_canvas, self.shape_id, previous_coords,
                 canvas_event[0], canvas_event[1],
-                self.insert_at_index, insert=False)
+                self.insert_at_index, insert=False,
+                canvas_limits=self._get_drag_canvas_limits(self.shape_id))
             self.image_canvas.modify_existing_shape_using_canvas_coords(self.shape_id, new_coords)
         elif self.mode == "shift":
-            _perform_shape_shift(self.image_canvas, self.shape_id, canvas_event, self.anchor, emit=True)
+            _perform_shape_shift(
+                self.image_canvas, self.shape_id, canvas_event, self.anchor, emit=True,
+                canvas_limits=self._get_drag_canvas_limits(self.shape_id))
             self.anchor = canvas_event
 
     def on_left_mouse_release(self, event):
@@ -1432,12 +1511,15 @@ class MeasureTool(ImageCanvasTool):
                 new_coords, _ = _modify_coords(
                     self.image_canvas, self.shape_id, previous_coords,
                     canvas_event[0], canvas_event[1],
-                    self.insert_at_index, insert=False)
+                    self.insert_at_index, insert=False,
+                    canvas_limits=self._get_drag_canvas_limits(self.shape_id))
                 self.image_canvas.modify_existing_shape_using_canvas_coords(self.shape_id, new_coords, emit=False)
                 self.image_canvas.event_generate('<<MeasurementCoordsFinalized>>')
         elif self.mode == "shift":
             if self.mouse_moved:
-                _perform_shape_shift(self.image_canvas, self.shape_id, canvas_event, self.anchor, emit=False)
+                _perform_shape_shift(
+                    self.image_canvas, self.shape_id, canvas_event, self.anchor, emit=False,
+                    canvas_limits=self._get_drag_canvas_limits(self.shape_id))
                 self.image_canvas.event_generate('<<MeasurementCoordsFinalized>>')
                 self.mode = "normal"
         self.mouse_moved = False